@@ -13,15 +13,18 @@ Navigation:
 - q: Quit (when not in a text field)
 """
 
+import os
+import selectors
+import statistics
 import sys
 import time
 import threading
-from queue import Queue, Empty
-from typing import Optional, Callable
+from collections import deque
+from typing import Optional, Callable, List
 
 from gui import GUIState, TextInput
 from renderer import GUIRenderer
-from terminals import Terminal, KeyEvent, InputEvent
+from terminals import Terminal, KeyEvent, KeyType, InputEvent
 from sixel import IS_ITERM2
 
 # Platform detection for render timing
@@ -33,33 +36,109 @@ RESTORE_CURSOR = "\x1b[u"
 MOVE_UP = "\x1b[{}A"    # Move cursor up N lines
 CURSOR_HOME = "\x1b[H"  # Move cursor to top-left
 
+# Cursor blink half-period; matches GUIRenderer's blink interval
+CURSOR_BLINK_PHASE = 0.6
+
+# Pre-encoded forms, written as bytes alongside each frame
+RESTORE_CURSOR_B = RESTORE_CURSOR.encode('ascii')
+CURSOR_HOME_B = CURSOR_HOME.encode('ascii')
+NL_B = b"\n"
+
+# Prefixes written ahead of each frame (home mode vs. reserve-save-restore mode)
+HOME_FRAME_PREFIX = CURSOR_HOME_B
+RESTORE_FRAME_PREFIX = RESTORE_CURSOR_B + NL_B  # Top margin avoids clipping
+
 
 class InputThread(threading.Thread):  # pragma: no cover
     """
     Background thread for reading keyboard input.
 
-    Reads events continuously and puts them in a queue for the main thread.
+    Reads events continuously and appends them to a deque for the main thread.
+    With a single producer and a single consumer, deque append/popleft are
+    atomic, so no queue lock is needed; the event wakes the consumer.
     """
 
-    def __init__(self, terminal: Terminal, event_queue: Queue):
+    def __init__(
+        self,
+        terminal: Terminal,
+        event_queue: "deque[InputEvent]",
+        input_available: threading.Event
+    ):
         super().__init__(daemon=True)
         self.terminal = terminal
         self.event_queue = event_queue
+        self.input_available = input_available
         self.running = True
+        self._wake_w: Optional[int] = None  # Write end of the stop pipe
+        self._wake_lock = threading.Lock()  # Guards _wake_w against close/write races
+
+    # Most events drained per wake-up, so a flood can't starve the stop check
+    MAX_BATCH = 64
+
+    def _queue_events(self, event: Optional[InputEvent]) -> None:
+        """Queue an event plus any already pending behind it, then signal once.
+
+        Bursts (paste, key autorepeat) are handed over in one batch instead
+        of waking the main thread per event.
+        """
+        if event is None:
+            return
+        append = self.event_queue.append
+        read_input = self.terminal.read_input
+        append(event)
+        for _ in range(self.MAX_BATCH - 1):
+            event = read_input(timeout=0)
+            if event is None:
+                break
+            append(event)
+        self.input_available.set()
 
     def run(self) -> None:
         """Continuously read input events and queue them."""
+        fd = self.terminal.fileno()
+        if fd is None:
+            self._run_polling()
+        else:
+            self._run_selector(fd)
+
+    def _run_polling(self) -> None:
+        """Poll for input with a short timeout (terminals without a fd)."""
         while self.running:
             try:
-                event = self.terminal.read_input(timeout=0.05)
-                if event is not None:
-                    self.event_queue.put(event)
+                self._queue_events(self.terminal.read_input(timeout=0.05))
             except Exception:
                 break
 
+    def _run_selector(self, fd: int) -> None:
+        """Sleep in the kernel until input (or a stop request) arrives."""
+        wake_r, self._wake_w = os.pipe()
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                selector.register(wake_r, selectors.EVENT_READ)
+                while self.running:
+                    ready = selector.select(timeout=1.0)
+                    if not self.running:
+                        break
+                    if any(key.fd == fd for key, _ in ready):
+                        self._queue_events(self.terminal.read_input(timeout=0))
+        except Exception:
+            pass
+        finally:
+            with self._wake_lock:
+                os.close(self._wake_w)
+                self._wake_w = None
+            os.close(wake_r)
+
     def stop(self) -> None:
         """Signal the thread to stop."""
         self.running = False
+        with self._wake_lock:
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b"\0")
+                except OSError:
+                    pass
 
 
 class RenderThread(threading.Thread):  # pragma: no cover
@@ -77,7 +156,7 @@ class RenderThread(threading.Thread):  # pragma: no cover
         self.running = True
         self.render_requested = threading.Event()
         self.frame_ready = threading.Event()
-        self.current_frame: Optional[str] = None
+        self.current_frame: Optional[bytes] = None
         self.render_lock = threading.Lock()
         self._render_id = 0  # Track which render request we're on
 
@@ -90,12 +169,12 @@ class RenderThread(threading.Thread):  # pragma: no cover
         self.render_requested.set()
         return render_id
 
-    def get_frame(self) -> Optional[str]:
+    def get_frame(self) -> Optional[bytes]:
         """Get the most recently rendered frame (non-blocking)."""
         with self.render_lock:
             return self.current_frame
 
-    def wait_for_frame(self, timeout: float = 0.0) -> Optional[str]:
+    def wait_for_frame(self, timeout: float = 0.0) -> Optional[bytes]:
         """Wait for a frame to be ready, with timeout."""
         if self.frame_ready.wait(timeout):
             with self.render_lock:
@@ -115,6 +194,10 @@ class RenderThread(threading.Thread):  # pragma: no cover
                 # Render the frame
                 try:
                     frame = self.renderer.render_frame(self.gui_state)
+                    # Publish even if a newer request arrived mid-render:
+                    # render_requested is set again, so the next pass picks
+                    # it up, and dropping the frame would stall the display
+                    # while requests keep outpacing renders
                     with self.render_lock:
                         self.current_frame = frame
                     self.frame_ready.set()
@@ -127,6 +210,69 @@ class RenderThread(threading.Thread):  # pragma: no cover
         self.render_requested.set()  # Wake up the thread
 
 
+class FramePacer:
+    """
+    Paces synchronous frames to a target rate from measured render cost.
+
+    The gap left after a frame finishes is the frame period minus the
+    predicted cost of the next render (the median of recent renders), so
+    finished frames land about 1/target_fps apart whether rendering is
+    fast or slow.
+    """
+
+    def __init__(self, target_fps: float, window: int = 9):
+        self.period = 1.0 / target_fps
+        self._costs: deque[float] = deque(maxlen=window)
+        self.idle_interval = self.period  # Gap to leave after a finished frame
+
+    @property
+    def predicted_cost(self) -> float:
+        """Predicted duration of the next render (0 until one is measured)."""
+        return statistics.median(self._costs) if self._costs else 0.0
+
+    def record(self, render_cost: float) -> None:
+        """Record how long a render took and update the idle interval."""
+        self._costs.append(render_cost)
+        self.idle_interval = max(0.0, self.period - self.predicted_cost)
+
+
+def compute_wait_timeout(
+    current_time: float,
+    wake_times: List[float]
+) -> Optional[float]:
+    """
+    Compute how long the main loop may block waiting for input.
+
+    Args:
+        current_time: The current loop time
+        wake_times: Times at which the loop has scheduled work
+            (pending display, cursor blink, animation tick)
+
+    Returns:
+        Seconds until the earliest wake time (never negative), or None
+        to block until the next input event when nothing is scheduled
+    """
+    if not wake_times:
+        return None
+    return max(0.0, min(wake_times) - current_time)
+
+
+def frame_signature(
+    dirty_version: int,
+    animation_version: int,
+    needs_cursor_blink: bool,
+    current_time: float
+) -> tuple[int, int, bool, int]:
+    """
+    Summarize everything that decides whether a new frame is needed.
+
+    Only counters and the cursor blink phase are included, so building the
+    signature costs O(1) regardless of how many windows exist.
+    """
+    blink_phase = int(current_time / CURSOR_BLINK_PHASE) if needs_cursor_blink else 0
+    return (dirty_version, animation_version, needs_cursor_blink, blink_phase)
+
+
 def process_input(
     event: Optional[InputEvent],
     gui_state: GUIState
@@ -151,85 +297,177 @@ def process_input(
     return True, False
 
 
-def process_key_event(event: KeyEvent, gui_state: GUIState) -> tuple[bool, bool]:
+def drain_input_events(
+    event_queue: "deque[InputEvent]",
+    gui_state: GUIState
+) -> tuple[bool, bool]:
     """
-    Process a keyboard event for navigation and interaction.
+    Process every queued input event without raising on an empty queue.
+
+    Stops at the first event that asks to quit, leaving later events queued.
+
+    Args:
+        event_queue: Events appended by the input thread
+        gui_state: The GUI state to update
 
     Returns:
-        Tuple of (should_continue, needs_render)
+        Tuple of (should_continue, needs_render), where needs_render is True
+        if any processed event changed visible state
     """
-    focused = gui_state.get_focused_component()
+    popleft = event_queue.popleft
+    needs_render = False
+    while event_queue:
+        event = popleft()
+        if (event_queue and event_queue[0] == event
+                and isinstance(event, KeyEvent) and event.key_type is _KT_ARROW):
+            # Fold a run of one repeated arrow key (auto-repeat) into a
+            # single call, so the handler and dirty marking run once
+            count = 1
+            while event_queue and event_queue[0] == event:
+                popleft()
+                count += 1
+            should_continue = True
+            event_needs_render = gui_state.handle_special_key(event.value, count)
+        else:
+            should_continue, event_needs_render = process_input(event, gui_state)
+        needs_render |= event_needs_render
+        if not should_continue:
+            return False, needs_render
+    return True, needs_render
 
-    # Check if focused component is a text input
-    is_text_input = isinstance(focused, TextInput) if focused else False
 
-    # Handle special keys
-    if event.key_type.value == 'special':
-        key = event.value
+def _is_text_input_focused(gui_state: GUIState) -> bool:
+    """Return whether the focused component is a text input."""
+    return isinstance(gui_state.get_focused_component(), TextInput)
 
-        # Quit on 'q' or Ctrl-C (but not when in text input)
-        if key == 'ctrl-c':
-            return False, False
 
-        # Tab navigation
-        if key == 'tab':
-            gui_state.focus_next()
-            return True, True
+# Key handlers take (gui_state, is_text_input) and return
+# (should_continue, needs_render)
+KeyHandler = Callable[[GUIState, bool], tuple[bool, bool]]
 
-        # Shift+Tab navigation (reverse)
-        if key == 'shift-tab':
-            gui_state.focus_previous()
-            return True, True
 
-        # Enter/Space to activate
-        if key in ('enter', 'space') and not is_text_input:
-            if focused:
-                gui_state.activate_focused()
-            return True, True
+def _quit(gui_state: GUIState, is_text_input: bool) -> tuple[bool, bool]:
+    """Quit the application."""
+    return False, False
 
-        # Backspace for text input
-        if key == 'backspace' and is_text_input:
-            if gui_state.handle_special_key('backspace'):
-                return True, True
 
-        # Enter in text field moves to next
-        if key == 'enter' and is_text_input:
-            gui_state.focus_next()
-            return True, True
+def _focus_next(gui_state: GUIState, is_text_input: bool) -> tuple[bool, bool]:
+    """Tab navigation."""
+    gui_state.focus_next()
+    return True, True
 
-        # Escape to unfocus text input
-        if key == 'escape' and is_text_input:
-            gui_state.clear_focus()
-            return True, True
 
-    # Handle arrow keys
-    if event.key_type.value == 'arrow':
-        direction = event.value
-        if gui_state.handle_special_key(direction):
-            return True, True
+def _focus_previous(gui_state: GUIState, is_text_input: bool) -> tuple[bool, bool]:
+    """Shift+Tab navigation (reverse)."""
+    gui_state.focus_previous()
+    return True, True
+
+
+def _activate(gui_state: GUIState, is_text_input: bool) -> tuple[bool, bool]:
+    """Enter/Space activate the focused component (not in text input)."""
+    if is_text_input:
         return True, False
+    gui_state.activate_focused()
+    return True, True
 
-    # Handle character input
-    if event.key_type.value == 'character':
-        char = event.value
 
-        # 'q' to quit (but not when in text input)
-        if char == 'q' and not is_text_input:
-            return False, False
+def _enter(gui_state: GUIState, is_text_input: bool) -> tuple[bool, bool]:
+    """Enter activates, or moves to the next field from a text input."""
+    if is_text_input:
+        return _focus_next(gui_state, is_text_input)
+    return _activate(gui_state, is_text_input)
 
-        # Space to activate (but not when in text input)
-        if char == ' ' and not is_text_input:
-            if focused:
-                gui_state.activate_focused()
-            return True, True
 
-        # Type in text input
-        if is_text_input:
-            if gui_state.handle_key(char):
-                return True, True
+def _backspace(gui_state: GUIState, is_text_input: bool) -> tuple[bool, bool]:
+    """Backspace deletes in a text input."""
+    if is_text_input and gui_state.handle_special_key('backspace'):
+        return True, True
+    return True, False
+
+
+def _escape(gui_state: GUIState, is_text_input: bool) -> tuple[bool, bool]:
+    """Escape unfocuses a text input."""
+    if is_text_input:
+        gui_state.clear_focus()
+        return True, True
+    return True, False
+
+
+# Special key name -> handler, built once so each key is one dict lookup
+_SPECIAL_HANDLERS: dict[str, KeyHandler] = {
+    'ctrl-c': _quit,
+    'tab': _focus_next,
+    'shift-tab': _focus_previous,
+    'enter': _enter,
+    'space': _activate,
+    'backspace': _backspace,
+    'escape': _escape,
+}
+
+# Character -> handler when no text input is focused ('q' quits, space activates)
+_CHAR_HANDLERS: dict[str, KeyHandler] = {
+    'q': _quit,
+    ' ': _activate,
+}
+
+# Handlers that act regardless of focus, so the focus lookup can be skipped
+_FOCUS_INDEPENDENT = frozenset((_quit, _focus_next, _focus_previous))
+
+
+def _process_special_key(event: KeyEvent, gui_state: GUIState) -> tuple[bool, bool]:
+    """Handle special keys (Tab, Enter, Escape, Backspace, Ctrl-C)."""
+    handler = _SPECIAL_HANDLERS.get(event.value)
+    if handler is None:
+        return True, False
+    if handler in _FOCUS_INDEPENDENT:
+        return handler(gui_state, False)
+    return handler(gui_state, _is_text_input_focused(gui_state))
+
+
+def _process_arrow_key(event: KeyEvent, gui_state: GUIState) -> tuple[bool, bool]:
+    """Handle arrow keys within the focused window."""
+    if gui_state.handle_special_key(event.value):
+        return True, True
+    return True, False
+
+
+def _process_character_key(event: KeyEvent, gui_state: GUIState) -> tuple[bool, bool]:
+    """Handle printable character input."""
+    char = event.value
+
+    # Type in text input ('q' and space are ordinary characters there)
+    if _is_text_input_focused(gui_state):
+        if gui_state.handle_key(char):
+            return True, True
+        return True, False
 
+    handler = _CHAR_HANDLERS.get(char)
+    if handler is None:
         return True, False
+    return handler(gui_state, False)
 
+
+# Key type members bound at module level; Enum members are singletons, so
+# dispatch compares by identity (Enum.__hash__ and .value are Python-level)
+_KT_SPECIAL = KeyType.SPECIAL
+_KT_ARROW = KeyType.ARROW
+_KT_CHARACTER = KeyType.CHARACTER
+
+
+def process_key_event(event: KeyEvent, gui_state: GUIState) -> tuple[bool, bool]:
+    """
+    Process a keyboard event for navigation and interaction.
+
+    Returns:
+        Tuple of (should_continue, needs_render)
+    """
+    kt = event.key_type
+    if kt is _KT_CHARACTER:
+        return _process_character_key(event, gui_state)
+    if kt is _KT_SPECIAL:
+        return _process_special_key(event, gui_state)
+    if kt is _KT_ARROW:
+        return _process_arrow_key(event, gui_state)
     return True, False
 
 
@@ -238,7 +476,8 @@ def run_app_loop(  # pragma: no cover
     renderer: GUIRenderer,
     terminal: Terminal,
     on_quit: Optional[Callable[[], None]] = None,
-    animation_callback: Optional[Callable[[float], None]] = None
+    animation_callback: Optional[Callable[[float], bool]] = None,
+    target_fps: Optional[float] = None
 ) -> None:
     """
     Run the main application loop.
@@ -251,9 +490,19 @@ def run_app_loop(  # pragma: no cover
         renderer: The GUI renderer
         terminal: Terminal instance for I/O
         on_quit: Optional callback when app exits
-        animation_callback: Optional callback for animations (called with delta time)
+        animation_callback: Optional callback for animations (called with delta time).
+            Returns True if it changed visible state; a frame is only rendered
+            for the callback when it does.
+        target_fps: Maximum display frame rate (default: 30 on macOS, 25 elsewhere)
+
+    Raises:
+        ValueError: If target_fps is not positive
     """
-    event_queue: Queue[InputEvent] = Queue()
+    if target_fps is not None and target_fps <= 0:
+        raise ValueError(f"target_fps must be positive, got {target_fps}")
+
+    event_queue: deque[InputEvent] = deque()
+    input_available = threading.Event()
     input_thread = None
     render_thread: Optional[RenderThread] = None
 
@@ -264,18 +513,36 @@ def run_app_loop(  # pragma: no cover
     # Will be set based on whether sixel fits in terminal
     use_home_position = False
 
+    # Hot-path methods bound once; LOAD_FAST is cheaper than LOAD_ATTR per tick
+    _write_chunks = terminal.write_chunks
+    _flush = terminal.flush
+    _render = renderer.render_frame
+    _get_focused = gui_state.get_focused_component
+    _clear_dirty = gui_state.clear_dirty
+    _wait_for_input = input_available.wait
+    _clear_input = input_available.clear
+    _drain_input = drain_input_events
+
+    # (length, hash) of the last frame written; bytes hashes are stable in-process
+    last_frame_fp: Optional[tuple[int, int]] = None
+
+    def display_frame(frame: bytes) -> None:
+        """Write a rendered frame with its cursor prefix in one call.
+
+        Frames identical to the one already on screen are skipped.
+        """
+        nonlocal last_frame_fp
+        fp = (len(frame), hash(frame))
+        if fp == last_frame_fp:
+            return
+        last_frame_fp = fp
+        prefix = HOME_FRAME_PREFIX if use_home_position else RESTORE_FRAME_PREFIX
+        _write_chunks((prefix, frame))
+        _flush()
+
     def render_frame():
         """Helper to render and display a frame."""
-        frame = renderer.render_frame(gui_state)
-        if use_home_position:
-            # Large sixel mode: always go to top-left
-            terminal.write(CURSOR_HOME)
-        else:
-            # Normal mode: restore to saved position
-            terminal.write(RESTORE_CURSOR)
-            terminal.write("\n")  # Top margin to avoid clipping command line
-        terminal.write(frame)
-        terminal.flush()
+        display_frame(_render(gui_state))
 
     try:
         with terminal:
@@ -291,17 +558,18 @@ def run_app_loop(  # pragma: no cover
                 terminal.flush()
             else:
                 # Sixel fits in terminal - use reserve-save-restore pattern
+                # Reserve rows, step back up and save the cursor in one write
                 rows_to_reserve = min(sixel_rows + 1, max(8, term_height // 3))
-                terminal.write("\n" * rows_to_reserve)
-                terminal.write(MOVE_UP.format(rows_to_reserve))
-                terminal.write(SAVE_CURSOR)
+                terminal.write(
+                    "\n" * rows_to_reserve + MOVE_UP.format(rows_to_reserve) + SAVE_CURSOR
+                )
                 terminal.flush()
 
             # Focus the first focusable component
             gui_state.focus_next()
 
             # Start input thread
-            input_thread = InputThread(terminal, event_queue)
+            input_thread = InputThread(terminal, event_queue, input_available)
             input_thread.start()
 
             # On macOS with sixel (not iTerm2), use async rendering to keep input responsive
@@ -314,89 +582,92 @@ def run_app_loop(  # pragma: no cover
 
             # Initial render (synchronous for first frame)
             render_frame()
+            gui_state.clear_dirty()
 
-            last_time = time.time()
-            last_render_time = time.time()
-            last_display_time = time.time()
+            # Monotonic clock: cheaper than time.time() and immune to wall-clock jumps
+            _now = time.monotonic
+            start_time = _now()
+            last_render_time = start_time
+            last_display_time = start_time
             running = True
 
             # Platform-specific timing
             # macOS: async rendering, just throttle display updates
             # Others: sync rendering with frame rate limit
+            if target_fps is None:
+                target_fps = 30.0 if IS_MACOS else 25.0
             min_render_interval = 0.05 if IS_MACOS else 0.04  # Request rate
-            min_display_interval = 0.033 if IS_MACOS else 0.04  # Display rate (30 FPS max)
+            min_display_interval = 1.0 / target_fps  # Display rate
+            pacer = FramePacer(target_fps)  # Sync mode: adapts to render cost
             cursor_blink_interval = 0.3 if IS_MACOS else 0.15
-            input_check_interval = 0.008  # Fast input checking on all platforms
+            async_poll_interval = 0.008  # Poll rate while an async frame is in flight
+            animation_interval = min_render_interval  # Callback rate without input
+            last_callback_time = start_time
 
             # Track if we have a pending render
             render_pending = False
-            last_frame_hash = 0
+            animation_version = 0  # Bumped when the animation callback changes state
+
+            # Focus only changes through GUIState mutators, which bump the dirty
+            # version, so the text-input check is redone only when it moves
+            focus_check_version = gui_state.dirty_version
+            focused = _get_focused()
+            needs_cursor_blink = isinstance(focused, TextInput) and focused.has_focus
+
+            # Seed with the state just drawn so the first tick doesn't redraw it
+            last_frame_sig = frame_signature(
+                gui_state.dirty_version, animation_version, needs_cursor_blink, start_time
+            )
+            wait_timeout: Optional[float] = 0.0
 
             while running:
-                current_time = time.time()
-                delta_time = current_time - last_time
-                last_time = current_time
+                # Sleep until input arrives or the next scheduled wake-up
+                _wait_for_input(wait_timeout)
+                # Clear before draining so an append during the drain re-signals
+                _clear_input()
 
-                # Process all queued input events immediately (responsive input)
-                input_processed = False
-                while True:
-                    try:
-                        event = event_queue.get_nowait()
-                        should_continue, _ = process_input(event, gui_state)
-                        input_processed = True
-                        if not should_continue:
-                            running = False
-                            break
-                    except Empty:
-                        break
+                current_time = _now()
 
+                # Process all queued input events immediately (responsive input)
+                # Only events that changed visible state count toward a render
+                running, input_needs_render = _drain_input(event_queue, gui_state)
                 if not running:
                     break
 
-                # Call animation callback if provided
-                if animation_callback:
-                    animation_callback(delta_time)
+                # Call the animation callback right after input that changed state
+                # (bound values may follow it) or once per animation interval;
+                # other wake-ups skip it. Render only if it changed something.
+                if animation_callback and (
+                    input_needs_render or
+                    current_time - last_callback_time >= animation_interval
+                ):
+                    delta_time = current_time - last_callback_time
+                    last_callback_time = current_time
+                    if animation_callback(delta_time):
+                        animation_version += 1
 
                 # Check if a text input is focused (need periodic redraws for cursor blink)
-                focused = gui_state.get_focused_component()
-                needs_cursor_blink = isinstance(focused, TextInput) and focused.has_focus
-
-                # Build component state for hash (capture all relevant state changes)
-                focused_state = None
-                if focused:
-                    if isinstance(focused, TextInput):
-                        focused_state = (focused.text, focused.cursor_pos)
-                    elif hasattr(focused, 'zoom'):  # ImageDisplay
-                        focused_state = focused.zoom
-                    elif hasattr(focused, 'checked'):  # Checkbox
-                        focused_state = focused.checked
-                    elif hasattr(focused, 'selected'):  # RadioButton
-                        focused_state = focused.selected
-                    elif hasattr(focused, 'pressed'):  # Button
-                        focused_state = focused.pressed
-                    elif hasattr(focused, 'value'):  # Slider, ProgressBar
-                        focused_state = focused.value
-                    elif hasattr(focused, 'selected_index'):  # ListBox
-                        focused_state = focused.selected_index
-
-                # Compute state hash to detect changes
-                state_hash = hash((
-                    gui_state._focused_window_index,
-                    tuple(gui_state._component_index_per_window.items()),
-                    tuple(w.active for w in gui_state.windows),
-                    focused_state,
-                    needs_cursor_blink,
-                    int(current_time / 0.6) if needs_cursor_blink else 0,
-                ))
+                if gui_state.dirty_version != focus_check_version:
+                    focus_check_version = gui_state.dirty_version
+                    focused = _get_focused()
+                    needs_cursor_blink = isinstance(focused, TextInput) and focused.has_focus
+
+                # Render signature: state versions plus the cursor blink phase
+                state_sig = frame_signature(
+                    gui_state.dirty_version, animation_version, needs_cursor_blink, current_time
+                )
 
                 time_since_render = current_time - last_render_time
                 time_since_display = current_time - last_display_time
 
                 # Determine if we need to render
-                state_changed = state_hash != last_frame_hash
+                state_changed = state_sig != last_frame_sig
+                # Clock reading the wait is scheduled from; only re-read after
+                # a frame write, the one step slow enough to matter
+                tick_end = current_time
                 should_request_render = (
                     state_changed or
-                    (input_processed and time_since_render >= min_render_interval) or
+                    (input_needs_render and time_since_render >= min_render_interval) or
                     (needs_cursor_blink and time_since_render >= cursor_blink_interval)
                 )
 
@@ -406,42 +677,43 @@ def run_app_loop(  # pragma: no cover
                         render_thread.request_render()
                         render_pending = True
                         last_render_time = current_time
-                        last_frame_hash = state_hash
+                        last_frame_sig = state_sig
 
                     # Check if a new frame is ready to display
                     if render_pending and time_since_display >= min_display_interval:
                         frame = render_thread.get_frame()
                         if frame:
-                            if use_home_position:
-                                terminal.write(CURSOR_HOME)
-                            else:
-                                terminal.write(RESTORE_CURSOR)
-                                terminal.write("\n")
-                            terminal.write(frame)
-                            terminal.flush()
+                            display_frame(frame)
+                            tick_end = _now()
                             last_display_time = current_time
                             render_pending = False
-                            gui_state.clear_dirty()
+                            _clear_dirty()
                 else:
-                    # Synchronous rendering for other platforms
-                    if should_request_render and time_since_display >= min_display_interval:
-                        frame = renderer.render_frame(gui_state)
-
-                        if use_home_position:
-                            terminal.write(CURSOR_HOME)
-                        else:
-                            terminal.write(RESTORE_CURSOR)
-                            terminal.write("\n")
-                        terminal.write(frame)
-                        terminal.flush()
-
-                        gui_state.clear_dirty()
+                    # Synchronous rendering for other platforms; display time
+                    # marks when the frame finished, paced by predicted cost
+                    if should_request_render and time_since_display >= pacer.idle_interval:
+                        render_frame()
+                        frame_done = tick_end = _now()
+                        pacer.record(frame_done - current_time)
+
+                        _clear_dirty()
                         last_render_time = current_time
-                        last_display_time = current_time
-                        last_frame_hash = state_hash
-
-                # Small sleep to prevent CPU spinning
-                time.sleep(input_check_interval)
+                        last_display_time = frame_done
+                        last_frame_sig = state_sig
+
+                # Schedule the next wake-up; with nothing pending, block on input
+                wake_times: List[float] = []
+                display_gap = min_display_interval if render_thread else pacer.idle_interval
+                if render_pending:
+                    wake_times.append(max(last_display_time + min_display_interval,
+                                          current_time + async_poll_interval))
+                elif state_sig != last_frame_sig:
+                    wake_times.append(last_display_time + display_gap)
+                if needs_cursor_blink:
+                    wake_times.append(last_render_time + cursor_blink_interval)
+                if animation_callback:
+                    wake_times.append(last_callback_time + animation_interval)
+                wait_timeout = compute_wait_timeout(tick_end, wake_times)
 
     except KeyboardInterrupt:
         pass
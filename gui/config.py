@@ -7,12 +7,20 @@ Supports variable bindings between widgets for reactive updates.
 
 import os
 import sys
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable
 from dataclasses import dataclass, field
 
 import yaml
 
+# libyaml's C parser when PyYAML was built with it; pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
 # Platform detection
 IS_MACOS = sys.platform == 'darwin'
 IS_ITERM2 = os.environ.get('TERM_PROGRAM', '').lower() == 'iterm.app'
@@ -37,6 +45,20 @@ from gui import (
 )
 
 
+# Vertical spacing after each widget type, pre-scaled for the platform
+_SPACING_MAP: Dict[str, int] = {
+    'button': 11 * PLATFORM_SCALE,        # 42 + 11 = 53 (from original: 68 - 15 = 53)
+    'checkbox': 9 * PLATFORM_SCALE,       # 36 + 9 = 45
+    'radio': 9 * PLATFORM_SCALE,          # 36 + 9 = 45
+    'text_input': 15 * PLATFORM_SCALE,    # 42 + 15 = 57
+    'slider': 22 * PLATFORM_SCALE,        # 30 + 22 = 52
+    'progress_bar': 16 * PLATFORM_SCALE,  # 36 + 16 = 52
+    'listbox': 0,
+    'image': 0,
+}
+_DEFAULT_SPACING = 10 * PLATFORM_SCALE
+
+
 @dataclass
 class LayoutConfig:
     """Layout configuration for the GUI."""
@@ -70,163 +92,224 @@ class GUIConfig:
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load a YAML configuration file."""
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def parse_layout(config: Dict[str, Any]) -> LayoutConfig:
     """Parse layout configuration from YAML with platform scaling."""
-    layout_data = config.get('layout', {})
+    return _build_layout(config.get('layout', {}))
+
+
+def _build_layout(layout_data: Dict[str, Any]) -> LayoutConfig:
+    """Build a scaled LayoutConfig from the 'layout' section."""
+    get = layout_data.get
     scale = PLATFORM_SCALE
     return LayoutConfig(
-        window_width=layout_data.get('window_width', 240) * scale,
-        window_height=layout_data.get('window_height', 210) * scale,
-        window_gap=layout_data.get('window_gap', 15) * scale,
-        start_x=layout_data.get('start_x', 15) * scale,
-        start_y=layout_data.get('start_y', 15) * scale,
-        title_bar_height=layout_data.get('title_bar_height', 36) * scale,
-        content_padding=layout_data.get('content_padding', 15) * scale,
+        window_width=get('window_width', 240) * scale,
+        window_height=get('window_height', 210) * scale,
+        window_gap=get('window_gap', 15) * scale,
+        start_x=get('start_x', 15) * scale,
+        start_y=get('start_y', 15) * scale,
+        title_bar_height=get('title_bar_height', 36) * scale,
+        content_padding=get('content_padding', 15) * scale,
     )
 
 
 def parse_bindings(config: Dict[str, Any]) -> List[Binding]:
     """Parse widget bindings from YAML."""
-    bindings_data = config.get('bindings', [])
-    bindings = []
-    for binding in bindings_data:
-        bindings.append(Binding(
+    return _build_bindings(config.get('bindings', []))
+
+
+def _build_bindings(bindings_data: List[Dict[str, Any]]) -> List[Binding]:
+    """Build Binding objects from the 'bindings' section."""
+    return [
+        Binding(
             source_id=binding['source'],
             target_id=binding['target'],
             property_name=binding.get('property', 'value'),
-        ))
-    return bindings
+        )
+        for binding in bindings_data
+    ]
+
+
+def _make_button(get: Callable, x: int, y: int, width: int, height: int,
+                 gui_config: GUIConfig, config_dir: Path) -> Component:
+    """Create a button."""
+    widget = Button(
+        x=x, y=y,
+        width=width, height=height,
+        label=get('label', ''),
+        toggle=get('toggle', False),
+    )
+    if not get('enabled', True):
+        widget.enabled = False
+    return widget
 
 
-def create_widget(
+def _make_checkbox(get: Callable, x: int, y: int, width: int, height: int,
+                   gui_config: GUIConfig, config_dir: Path) -> Component:
+    """Create a checkbox."""
+    return Checkbox(
+        x=x, y=y,
+        width=width, height=height,
+        label=get('label', ''),
+        checked=get('checked', False),
+    )
+
+
+def _make_radio(get: Callable, x: int, y: int, width: int, height: int,
+                gui_config: GUIConfig, config_dir: Path) -> Component:
+    """Create a radio button, joining its group if one is named."""
+    widget = RadioButton(
+        x=x, y=y,
+        width=width, height=height,
+        label=get('label', ''),
+        selected=get('selected', False),
+    )
+    # Add to radio group if specified
+    group_name = get('group')
+    if group_name:
+        if group_name not in gui_config.radio_groups:
+            gui_config.radio_groups[group_name] = RadioGroup()
+        gui_config.radio_groups[group_name].add_button(widget)
+    return widget
+
+
+def _make_text_input(get: Callable, x: int, y: int, width: int, height: int,
+                     gui_config: GUIConfig, config_dir: Path) -> Component:
+    """Create a text input."""
+    return TextInput(
+        x=x, y=y,
+        width=width, height=height,
+        placeholder=get('placeholder', ''),
+        max_length=get('max_length', 20),
+    )
+
+
+def _make_slider(get: Callable, x: int, y: int, width: int, height: int,
+                 gui_config: GUIConfig, config_dir: Path) -> Component:
+    """Create a slider."""
+    return Slider(
+        x=x, y=y,
+        width=width, height=height,
+        min_value=get('min_value', 0.0),
+        max_value=get('max_value', 100.0),
+        value=get('value', 50.0),
+    )
+
+
+def _make_progress_bar(get: Callable, x: int, y: int, width: int, height: int,
+                       gui_config: GUIConfig, config_dir: Path) -> Component:
+    """Create a progress bar."""
+    return ProgressBar(
+        x=x, y=y,
+        width=width, height=height,
+        value=get('value', 0.0),
+        max_value=get('max_value', 100.0),
+    )
+
+
+def _make_listbox(get: Callable, x: int, y: int, width: int, height: int,
+                  gui_config: GUIConfig, config_dir: Path) -> Component:
+    """Create a list box with an optional initial selection."""
+    widget = ListBox(
+        x=x, y=y,
+        width=width, height=height,
+        items=get('items', []),
+    )
+    selected_index = get('selected_index')
+    if selected_index is not None:
+        widget.select_index(selected_index)
+    return widget
+
+
+def _make_image(get: Callable, x: int, y: int, width: int, height: int,
+                gui_config: GUIConfig, config_dir: Path) -> Component:
+    """Create an image display, resolving relative paths from the config directory."""
+    image_path = get('image_path', '')
+    # Resolve relative paths from config directory
+    if image_path and not Path(image_path).is_absolute():
+        image_path = str(config_dir / image_path)
+    return ImageDisplay(
+        x=x, y=y,
+        width=width, height=height,
+        image_path=image_path if image_path else None,
+    )
+
+
+# Widget type -> factory taking (config getter, x, y, width, height,
+# gui_config, config_dir); unknown types produce no widget
+_WIDGET_FACTORIES: Dict[str, Callable[..., Component]] = {
+    'button': _make_button,
+    'checkbox': _make_checkbox,
+    'radio': _make_radio,
+    'text_input': _make_text_input,
+    'slider': _make_slider,
+    'progress_bar': _make_progress_bar,
+    'listbox': _make_listbox,
+    'image': _make_image,
+}
+
+
+def _create_widget_with_spacing(
     widget_config: Dict[str, Any],
     x: int,
     y: int,
     default_width: int,
     gui_config: GUIConfig,
     config_dir: Path,
-) -> Optional[Component]:
-    """Create a widget from configuration."""
-    widget_type = widget_config.get('type')
-    widget_id = widget_config.get('id')
+) -> tuple[Optional[Component], int]:
+    """
+    Create a widget from configuration along with its vertical spacing.
+
+    Reads each config key once, so the layout walk needn't revisit the
+    dict to compute spacing.
+
+    Returns:
+        Tuple of (widget or None, vertical offset to the next widget)
+    """
+    get = widget_config.get
+    widget_type = get('type')
     scale = PLATFORM_SCALE
-    height = widget_config.get('height', 36) * scale
+    height = get('height', 36) * scale
 
     # Calculate width - can be adjusted with width_offset (also scaled)
-    width_offset = widget_config.get('width_offset', 0) * scale
+    width_offset = get('width_offset', 0) * scale
     width = default_width + width_offset
 
     widget: Optional[Component] = None
-
-    if widget_type == 'button':
-        widget = Button(
-            x=x, y=y,
-            width=width, height=height,
-            label=widget_config.get('label', ''),
-            toggle=widget_config.get('toggle', False),
-        )
-        if not widget_config.get('enabled', True):
-            widget.enabled = False
-
-    elif widget_type == 'checkbox':
-        widget = Checkbox(
-            x=x, y=y,
-            width=width, height=height,
-            label=widget_config.get('label', ''),
-            checked=widget_config.get('checked', False),
-        )
-
-    elif widget_type == 'radio':
-        widget = RadioButton(
-            x=x, y=y,
-            width=width, height=height,
-            label=widget_config.get('label', ''),
-            selected=widget_config.get('selected', False),
-        )
-        # Add to radio group if specified
-        group_name = widget_config.get('group')
-        if group_name:
-            if group_name not in gui_config.radio_groups:
-                gui_config.radio_groups[group_name] = RadioGroup()
-            gui_config.radio_groups[group_name].add_button(widget)
-
-    elif widget_type == 'text_input':
-        widget = TextInput(
-            x=x, y=y,
-            width=width, height=height,
-            placeholder=widget_config.get('placeholder', ''),
-            max_length=widget_config.get('max_length', 20),
-        )
-
-    elif widget_type == 'slider':
-        widget = Slider(
-            x=x, y=y,
-            width=width, height=height,
-            min_value=widget_config.get('min_value', 0.0),
-            max_value=widget_config.get('max_value', 100.0),
-            value=widget_config.get('value', 50.0),
-        )
-
-    elif widget_type == 'progress_bar':
-        widget = ProgressBar(
-            x=x, y=y,
-            width=width, height=height,
-            value=widget_config.get('value', 0.0),
-            max_value=widget_config.get('max_value', 100.0),
-        )
-
-    elif widget_type == 'listbox':
-        items = widget_config.get('items', [])
-        widget = ListBox(
-            x=x, y=y,
-            width=width, height=height,
-            items=items,
-        )
-        selected_index = widget_config.get('selected_index')
-        if selected_index is not None:
-            widget.select_index(selected_index)
-
-    elif widget_type == 'image':
-        image_path = widget_config.get('image_path', '')
-        # Resolve relative paths from config directory
-        if image_path and not Path(image_path).is_absolute():
-            image_path = str(config_dir / image_path)
-        widget = ImageDisplay(
-            x=x, y=y,
-            width=width, height=height,
-            image_path=image_path if image_path else None,
-        )
+    factory = _WIDGET_FACTORIES.get(widget_type)
+    if factory is not None:
+        widget = factory(get, x, y, width, height, gui_config, config_dir)
 
     # Register widget by ID
+    widget_id = get('id')
     if widget and widget_id:
         gui_config.widgets_by_id[widget_id] = widget
 
+    return widget, height + _SPACING_MAP.get(widget_type, _DEFAULT_SPACING)
+
+
+def create_widget(
+    widget_config: Dict[str, Any],
+    x: int,
+    y: int,
+    default_width: int,
+    gui_config: GUIConfig,
+    config_dir: Path,
+) -> Optional[Component]:
+    """Create a widget from configuration."""
+    widget, _ = _create_widget_with_spacing(
+        widget_config, x, y, default_width, gui_config, config_dir
+    )
     return widget
 
 
 def calculate_widget_spacing(widget_config: Dict[str, Any]) -> int:
     """Calculate vertical spacing for a widget based on its type and height."""
-    widget_type = widget_config.get('type')
-    scale = PLATFORM_SCALE
-    height = widget_config.get('height', 36) * scale
-
-    # Different widget types have different default spacing (scaled)
-    spacing_map = {
-        'button': 11 * scale,      # 42 + 11 = 53 (from original: 68 - 15 = 53)
-        'checkbox': 9 * scale,     # 36 + 9 = 45
-        'radio': 9 * scale,        # 36 + 9 = 45
-        'text_input': 15 * scale,  # 42 + 15 = 57
-        'slider': 22 * scale,      # 30 + 22 = 52
-        'progress_bar': 16 * scale, # 36 + 16 = 52
-        'listbox': 0,
-        'image': 0,
-    }
-
-    base_spacing = spacing_map.get(widget_type, 10 * scale)
-    return height + base_spacing
+    get = widget_config.get
+    height = get('height', 36) * PLATFORM_SCALE
+    return height + _SPACING_MAP.get(get('type'), _DEFAULT_SPACING)
 
 
 def build_gui_from_config(config_path: str) -> tuple[GUIState, GUIConfig, int, int]:
@@ -239,9 +322,12 @@ def build_gui_from_config(config_path: str) -> tuple[GUIState, GUIConfig, int, i
     config_dir = Path(config_path).parent
     config = load_config(config_path)
 
-    layout = parse_layout(config)
-    bindings = parse_bindings(config)
-    variables = config.get('variables', {})
+    # Pull each top-level section once
+    get = config.get
+    layout = _build_layout(get('layout', {}))
+    bindings = _build_bindings(get('bindings', []))
+    variables = get('variables', {})
+    rows = get('rows', [])
 
     gui_config = GUIConfig(
         layout=layout,
@@ -250,7 +336,6 @@ def build_gui_from_config(config_path: str) -> tuple[GUIState, GUIConfig, int, i
     )
 
     gui = GUIState()
-    rows = config.get('rows', [])
 
     # Track max windows per row for frame size calculation
     max_windows_per_row = 0
@@ -289,7 +374,7 @@ def build_gui_from_config(config_path: str) -> tuple[GUIState, GUIConfig, int, i
             current_y = content_y
 
             for widget_config in widgets:
-                widget = create_widget(
+                widget, spacing = _create_widget_with_spacing(
                     widget_config,
                     x=content_x,
                     y=current_y,
@@ -300,7 +385,7 @@ def build_gui_from_config(config_path: str) -> tuple[GUIState, GUIConfig, int, i
 
                 if widget:
                     window.add_component(widget)
-                    current_y += calculate_widget_spacing(widget_config)
+                    current_y += spacing
 
             gui.add_window(window)
 
@@ -321,36 +406,57 @@ def build_gui_from_config(config_path: str) -> tuple[GUIState, GUIConfig, int, i
     return gui, gui_config, frame_width, frame_height
 
 
-def apply_bindings(gui_config: GUIConfig) -> Callable[[float], None]:
-    """
-    Create a sync callback that applies bindings between widgets.
+# Marks a compiled binding that has not synced a value yet
+_UNSYNCED = object()
 
-    Returns a callback function suitable for the animation loop.
-    """
-    prev_values: Dict[str, Any] = {}
 
-    def sync_callback(delta_time: float) -> None:
-        for binding in gui_config.bindings:
-            source = gui_config.widgets_by_id.get(binding.source_id)
-            target = gui_config.widgets_by_id.get(binding.target_id)
+def _compile_bindings(gui_config: GUIConfig) -> List[List[Any]]:
+    """
+    Resolve bindings into a sync plan once, up front.
 
-            if source is None or target is None:
-                continue
+    Each entry is a mutable [source, getter, setter, last_value] list, where
+    getter is an attrgetter for the property and setter a partial of setattr
+    on the target, so syncing does no attribute-name lookups in Python.
+    Bindings whose endpoints are missing, or lack the property, are dropped
+    here rather than re-checked on every tick.
+    """
+    widgets_by_id = gui_config.widgets_by_id
+    plan: List[List[Any]] = []
+    for binding in gui_config.bindings:
+        source = widgets_by_id.get(binding.source_id)
+        target = widgets_by_id.get(binding.target_id)
+        prop = binding.property_name
+        if source is None or target is None:
+            continue
+        if not hasattr(source, prop) or not hasattr(target, prop):
+            continue
+        plan.append([source, attrgetter(prop), partial(setattr, target, prop), _UNSYNCED])
+    return plan
+
+
+def apply_bindings(gui_config: GUIConfig) -> Callable[[float], bool]:
+    """
+    Create a sync callback that applies bindings between widgets.
 
-            # Get source value
-            source_value = getattr(source, binding.property_name, None)
-            if source_value is None:
-                continue
+    Bindings are compiled when this is called; widgets and bindings added
+    to the config afterwards are not picked up.
 
-            # Check if value changed
-            cache_key = f"{binding.source_id}.{binding.property_name}"
-            if prev_values.get(cache_key) == source_value:
+    Returns a callback function suitable for the animation loop. The
+    callback returns True if any target widget was updated.
+    """
+    plan = _compile_bindings(gui_config)
+
+    def sync_callback(delta_time: float) -> bool:
+        changed = False
+        for entry in plan:
+            source_value = entry[1](entry[0])
+            # Unchanged values are usually the very same object
+            if source_value is None or source_value is entry[3] or source_value == entry[3]:
                 continue
-
-            # Update target
-            if hasattr(target, binding.property_name):
-                setattr(target, binding.property_name, source_value)
-                prev_values[cache_key] = source_value
+            entry[2](source_value)
+            entry[3] = source_value
+            changed = True
+        return changed
 
     return sync_callback
 
@@ -16,7 +16,8 @@ import os
 import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from operator import methodcaller
 from pathlib import Path
 from typing import Protocol, Tuple, List, Optional, Callable, runtime_checkable
 
@@ -36,27 +37,143 @@ except ImportError:
 from sixel import register_image_colors
 
 
-class ComponentState(Enum):
-    """Visual states for interactive components."""
-    NORMAL = "normal"
-    HOVER = "hover"
-    PRESSED = "pressed"
-    DISABLED = "disabled"
-    FOCUSED = "focused"
+class ComponentState(IntEnum):
+    """
+    Visual states for interactive components.
+
+    Integer-valued so state checks are plain int comparisons.
+    """
+    NORMAL = 0
+    HOVER = 1
+    PRESSED = 2
+    DISABLED = 3
+    FOCUSED = 4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Bounds:
-    """Rectangular bounds for hit testing and rendering."""
+    """
+    Rectangular bounds for hit testing and rendering.
+
+    Immutable, so the right/bottom edges can be computed once.
+    """
     x: int
     y: int
     width: int
     height: int
+    _x2: int = field(init=False, repr=False, compare=False)
+    _y2: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_x2', self.x + self.width)
+        object.__setattr__(self, '_y2', self.y + self.height)
 
     def contains(self, px: int, py: int) -> bool:
         """Check if a point is inside this bounds."""
-        return (self.x <= px < self.x + self.width and
-                self.y <= py < self.y + self.height)
+        return self.x <= px < self._x2 and self.y <= py < self._y2
+
+
+class Quadtree:
+    """
+    Point-query spatial index over rectangles, for hit testing.
+
+    Each item is stored with its insertion order so callers can pick the
+    topmost (last added) of several overlapping hits. Items spanning
+    several quadrants are stored in each of them, so a point query walks
+    a single root-to-leaf path.
+    """
+
+    MAX_ITEMS = 4   # Split a leaf once it holds more than this
+    MIN_SIZE = 8    # Don't split quadrants smaller than this (pixels)
+    MAX_DEPTH = 8
+
+    def __init__(self, x: int, y: int, width: int, height: int, depth: int = 0):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self._depth = depth
+        # (x1, y1, x2, y2, order, item)
+        self._items: List[tuple] = []
+        self._children: Optional[List["Quadtree"]] = None
+        self._mid_x = x + width // 2
+        self._mid_y = y + height // 2
+
+    @classmethod
+    def build(cls, rects: List[Tuple[int, int, int, int, object]]) -> "Quadtree":
+        """Build a tree over (x, y, width, height, item) tuples, in z-order."""
+        if not rects:
+            return cls(0, 0, 0, 0)
+        x1 = min(r[0] for r in rects)
+        y1 = min(r[1] for r in rects)
+        x2 = max(r[0] + r[2] for r in rects)
+        y2 = max(r[1] + r[3] for r in rects)
+        tree = cls(x1, y1, x2 - x1, y2 - y1)
+        for order, (x, y, w, h, item) in enumerate(rects):
+            tree.insert(x, y, w, h, order, item)
+        return tree
+
+    def insert(self, x: int, y: int, width: int, height: int, order: int, item: object) -> None:
+        """Insert an item covering the given rectangle."""
+        if width <= 0 or height <= 0:
+            return
+        self._insert((x, y, x + width, y + height, order, item))
+
+    def _insert(self, entry: tuple) -> None:
+        if self._children is not None:
+            for child in self._children:
+                if child._overlaps(entry):
+                    child._insert(entry)
+            return
+        self._items.append(entry)
+        if (len(self._items) > self.MAX_ITEMS and self._depth < self.MAX_DEPTH
+                and self.width >= 2 * self.MIN_SIZE and self.height >= 2 * self.MIN_SIZE):
+            self._split()
+
+    def _overlaps(self, entry: tuple) -> bool:
+        return (entry[0] < self.x + self.width and self.x < entry[2] and
+                entry[1] < self.y + self.height and self.y < entry[3])
+
+    def _split(self) -> None:
+        x, y, depth = self.x, self.y, self._depth + 1
+        left_w, top_h = self._mid_x - x, self._mid_y - y
+        right_w, bottom_h = self.width - left_w, self.height - top_h
+        self._children = [
+            Quadtree(x, y, left_w, top_h, depth),
+            Quadtree(self._mid_x, y, right_w, top_h, depth),
+            Quadtree(x, self._mid_y, left_w, bottom_h, depth),
+            Quadtree(self._mid_x, self._mid_y, right_w, bottom_h, depth),
+        ]
+        items, self._items = self._items, []
+        for entry in items:
+            self._insert(entry)
+
+    def query_point(self, px: int, py: int) -> List[Tuple[int, object]]:
+        """Return (order, item) for every item whose rectangle contains the point."""
+        node = self
+        while node._children is not None:
+            index = (1 if px >= node._mid_x else 0) + (2 if py >= node._mid_y else 0)
+            node = node._children[index]
+        return [(e[4], e[5]) for e in node._items
+                if e[0] <= px < e[2] and e[1] <= py < e[3]]
+
+    def occluded_items(self) -> set:
+        """Return the items partly covered by some later-inserted item."""
+        # Overlapping items always share a leaf, so only pairs within
+        # each leaf need checking
+        occluded = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._children is not None:
+                stack.extend(node._children)
+                continue
+            items = node._items
+            for i, a in enumerate(items):
+                for b in items[i + 1:]:
+                    if a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]:
+                        occluded.add(a[5] if a[4] < b[4] else b[5])
+        return occluded
 
 
 @runtime_checkable
@@ -107,6 +224,16 @@ class Component(ABC):
     All components have bounds, state, and can be rendered.
     """
 
+    __slots__ = ('_bounds', '_state', '_enabled', '_visible')
+
+    # Bumped whenever any component is enabled or disabled, so caches of
+    # enabled components (see GUIState._get_interactive_components) can
+    # tell when to refilter
+    _enabled_generation: int = 0
+
+    # Whether keyboard focus can land on this component type
+    is_interactive: bool = True
+
     def __init__(self, x: int, y: int, width: int, height: int):
         self._bounds = Bounds(x, y, width, height)
         self._state = ComponentState.NORMAL
@@ -152,6 +279,8 @@ class Component(ABC):
 
     @enabled.setter
     def enabled(self, value: bool) -> None:
+        if value != self._enabled:
+            Component._enabled_generation += 1
         self._enabled = value
 
     @property
@@ -166,10 +295,32 @@ class Component(ABC):
         """Check if a point is within this component."""
         return self._bounds.contains(x, y)
 
-    def set_hover(self, is_hover: bool) -> None:
-        """Set hover state."""
+    def set_hover(self, is_hover: bool) -> bool:
+        """
+        Set hover state.
+
+        Returns True if the state changed, so callers only need to redraw
+        when the pointer crosses into or out of the component.
+        """
         if self._enabled:
-            self._state = ComponentState.HOVER if is_hover else ComponentState.NORMAL
+            new_state = ComponentState.HOVER if is_hover else ComponentState.NORMAL
+            if self._state is not new_state:
+                self._state = new_state
+                return True
+        return False
+
+    def on_click(self, px: int, py: int) -> None:
+        """Handle a click, if it lands on this enabled component."""
+        if self._enabled and self.contains_point(px, py):
+            self._click_at(px, py)
+
+    def _click_at(self, px: int, py: int) -> None:
+        """
+        Respond to a click already known to hit this enabled component.
+
+        GUIState.handle_click calls this directly once its hit test has
+        found the component, so the bounds are not checked twice.
+        """
 
 
 class Button(Component):
@@ -179,6 +330,8 @@ class Button(Component):
     Supports toggle mode where button stays pressed until clicked again.
     """
 
+    __slots__ = ('label', '_on_click', '_toggle_mode', '_toggled')
+
     def __init__(
         self,
         x: int, y: int,
@@ -205,10 +358,9 @@ class Button(Component):
             if self._on_click:
                 self._on_click()
 
-    def on_click(self, px: int, py: int) -> None:
+    def _click_at(self, px: int, py: int) -> None:
         """Handle click event."""
-        if self._enabled and self.contains_point(px, py):
-            self.toggle()
+        self.toggle()
 
 
 class Checkbox(Component):
@@ -216,6 +368,8 @@ class Checkbox(Component):
     A checkbox component that toggles between checked/unchecked.
     """
 
+    __slots__ = ('label', '_checked', '_on_change')
+
     def __init__(
         self,
         x: int, y: int,
@@ -244,10 +398,9 @@ class Checkbox(Component):
             if self._on_change:
                 self._on_change(self._checked)
 
-    def on_click(self, px: int, py: int) -> None:
+    def _click_at(self, px: int, py: int) -> None:
         """Handle click event."""
-        if self._enabled and self.contains_point(px, py):
-            self.toggle()
+        self.toggle()
 
 
 class RadioGroup:
@@ -263,20 +416,22 @@ class RadioGroup:
     def add_button(self, button: "RadioButton") -> None:
         """Add a radio button to this group."""
         button._group = self
+        button._group_index = len(self._buttons)
         self._buttons.append(button)
         if button.selected:
             self._select_button(button)
 
     def _select_button(self, selected: "RadioButton") -> None:
-        """Select a button, deselecting others."""
-        for i, button in enumerate(self._buttons):
-            if button is selected:
-                button._selected = True
-                self._selected_index = i
-            else:
-                button._selected = False
-
-        if self._on_change and self._selected_index >= 0:
+        """Select a button, deselecting the previously selected one."""
+        # Only the outgoing and incoming buttons change, so there is no
+        # need to sweep the whole group.
+        previous = self._selected_index
+        if previous >= 0:
+            self._buttons[previous]._selected = False
+        selected._selected = True
+        self._selected_index = selected._group_index
+
+        if self._on_change:
             self._on_change(self._selected_index, selected.label)
 
     @property
@@ -299,6 +454,8 @@ class RadioButton(Component):
     A radio button component - part of a RadioGroup.
     """
 
+    __slots__ = ('label', '_selected', '_group', '_group_index')
+
     def __init__(
         self,
         x: int, y: int,
@@ -310,6 +467,7 @@ class RadioButton(Component):
         self.label = label
         self._selected = selected
         self._group: Optional[RadioGroup] = None
+        self._group_index = -1
 
     @property
     def selected(self) -> bool:
@@ -324,10 +482,9 @@ class RadioButton(Component):
         if self._enabled and self._group:
             self._group._select_button(self)
 
-    def on_click(self, px: int, py: int) -> None:
+    def _click_at(self, px: int, py: int) -> None:
         """Handle click event."""
-        if self._enabled and self.contains_point(px, py):
-            self.select()
+        self.select()
 
 
 class TextInput(Component):
@@ -337,6 +494,11 @@ class TextInput(Component):
     Supports text entry, cursor position, and focus.
     """
 
+    __slots__ = (
+        'placeholder', 'max_length', '_before', '_after', '_text',
+        '_has_focus', '_on_change',
+    )
+
     def __init__(
         self,
         x: int, y: int,
@@ -348,22 +510,30 @@ class TextInput(Component):
         super().__init__(x, y, width, height)
         self.placeholder = placeholder
         self.max_length = max_length
-        self._text = ""
-        self._cursor_pos = 0
+        # Gap buffer: characters left of the cursor in order, characters
+        # right of the cursor reversed, so edits at the cursor are O(1).
+        self._before: List[str] = []
+        self._after: List[str] = []
+        self._text: Optional[str] = ""
         self._has_focus = False
         self._on_change = on_change
 
     @property
     def text(self) -> str:
-        return self._text
+        text = self._text
+        if text is None:
+            text = self._text = (
+                "".join(self._before) + "".join(reversed(self._after))
+            )
+        return text
 
     @property
     def value(self) -> str:
-        return self._text
+        return self.text
 
     @property
     def cursor_pos(self) -> int:
-        return self._cursor_pos
+        return len(self._before)
 
     @property
     def has_focus(self) -> bool:
@@ -379,43 +549,35 @@ class TextInput(Component):
         self._has_focus = False
         self._state = ComponentState.NORMAL
 
-    def on_click(self, px: int, py: int) -> None:
+    def _click_at(self, px: int, py: int) -> None:
         """Handle click event - focus the input."""
-        if self._enabled and self.contains_point(px, py):
-            self.focus()
+        self.focus()
 
     def insert_char(self, char: str) -> None:
         """Insert a character at cursor position."""
-        if self._has_focus and len(self._text) < self.max_length:
-            self._text = (
-                self._text[:self._cursor_pos] +
-                char +
-                self._text[self._cursor_pos:]
-            )
-            self._cursor_pos += 1
+        if self._has_focus and len(self._before) + len(self._after) < self.max_length:
+            self._before.append(char)
+            self._text = None
             if self._on_change:
-                self._on_change(self._text)
+                self._on_change(self.text)
 
     def delete_char(self) -> None:
         """Delete character before cursor (backspace)."""
-        if self._has_focus and self._cursor_pos > 0:
-            self._text = (
-                self._text[:self._cursor_pos - 1] +
-                self._text[self._cursor_pos:]
-            )
-            self._cursor_pos -= 1
+        if self._has_focus and self._before:
+            self._before.pop()
+            self._text = None
             if self._on_change:
-                self._on_change(self._text)
+                self._on_change(self.text)
 
     def move_cursor_left(self) -> None:
         """Move cursor left."""
-        if self._cursor_pos > 0:
-            self._cursor_pos -= 1
+        if self._before:
+            self._after.append(self._before.pop())
 
     def move_cursor_right(self) -> None:
         """Move cursor right."""
-        if self._cursor_pos < len(self._text):
-            self._cursor_pos += 1
+        if self._after:
+            self._before.append(self._after.pop())
 
 
 class Slider(Component):
@@ -423,6 +585,11 @@ class Slider(Component):
     A slider component for selecting a value in a range.
     """
 
+    __slots__ = (
+        '_min_value', '_max_value', '_range', '_step', '_pct_scale', '_value',
+        '_percentage', '_on_change', '_dragging',
+    )
+
     def __init__(
         self,
         x: int, y: int,
@@ -433,40 +600,67 @@ class Slider(Component):
         on_change: Optional[Callable[[float], None]] = None
     ):
         super().__init__(x, y, width, height)
-        self.min_value = min_value
-        self.max_value = max_value
+        self._min_value = min_value
+        self._max_value = max_value
         self._value = max(min_value, min(value, max_value))
+        self._update_range()
         self._on_change = on_change
         self._dragging = False
 
+    def _update_range(self) -> None:
+        """Precompute range-derived constants used on every value change."""
+        range_val = self._max_value - self._min_value
+        self._range = range_val
+        # Arrow keys move by a twentieth of the range
+        self._step = range_val / 20
+        # 100 / range, so percentage is a subtract and a multiply
+        self._pct_scale = 100.0 / range_val if range_val else 0.0
+        self._percentage = (self._value - self._min_value) * self._pct_scale
+
+    @property
+    def min_value(self) -> float:
+        return self._min_value
+
+    @min_value.setter
+    def min_value(self, v: float) -> None:
+        self._min_value = v
+        self._update_range()
+
+    @property
+    def max_value(self) -> float:
+        return self._max_value
+
+    @max_value.setter
+    def max_value(self, v: float) -> None:
+        self._max_value = v
+        self._update_range()
+
     @property
     def value(self) -> float:
         return self._value
 
     @value.setter
     def value(self, v: float) -> None:
-        new_value = max(self.min_value, min(v, self.max_value))
+        lo = self._min_value
+        hi = self._max_value
+        new_value = lo if v < lo else hi if v > hi else v
         if new_value != self._value:
             self._value = new_value
+            self._percentage = (new_value - lo) * self._pct_scale
             if self._on_change:
                 self._on_change(self._value)
 
     @property
     def percentage(self) -> float:
         """Get value as percentage (0-100)."""
-        range_val = self.max_value - self.min_value
-        if range_val == 0:
-            return 0.0
-        return ((self._value - self.min_value) / range_val) * 100
+        # Kept up to date by the setters; read on every frame
+        return self._percentage
 
-    def on_click(self, px: int, py: int) -> None:
+    def _click_at(self, px: int, py: int) -> None:
         """Handle click - set value based on click position."""
-        if self._enabled and self.contains_point(px, py):
-            # Calculate value from click position
-            rel_x = px - self.x
-            percentage = rel_x / self.width
-            range_val = self.max_value - self.min_value
-            self.value = self.min_value + percentage * range_val
+        # Calculate value from click position
+        bounds = self._bounds
+        self.value = self._min_value + (px - bounds.x) / bounds.width * self._range
 
 
 class ProgressBar(Component):
@@ -474,6 +668,12 @@ class ProgressBar(Component):
     A progress bar component showing completion percentage.
     """
 
+    __slots__ = (
+        '_value', '_max_value', '_percentage', '_animated', '_animation_offset',
+    )
+
+    is_interactive = False
+
     def __init__(
         self,
         x: int, y: int,
@@ -482,8 +682,8 @@ class ProgressBar(Component):
         max_value: float = 100.0
     ):
         super().__init__(x, y, width, height)
-        self._value = max(0, min(value, max_value))
         self._max_value = max_value
+        self.value = value
         self._animated = False
         self._animation_offset = 0
 
@@ -493,27 +693,31 @@ class ProgressBar(Component):
 
     @value.setter
     def value(self, v: float) -> None:
-        self._value = max(0, min(v, self._max_value))
+        self._value = value = max(0, min(v, self._max_value))
+        max_value = self._max_value
+        self._percentage = (value / max_value) * 100 if max_value else 0.0
 
     @property
     def percentage(self) -> float:
         """Get value as percentage."""
-        if self._max_value == 0:
-            return 0.0
-        return (self._value / self._max_value) * 100
+        return self._percentage
 
     def increment(self, amount: float = 1.0) -> None:
         """Increment the progress value."""
         self.value = self._value + amount
 
-    def on_click(self, px: int, py: int) -> None:
-        """Progress bars don't respond to clicks by default."""
-        pass
+
+def _listbox_index(py: int, top: int, item_height: int, scroll_offset: int, n_items: int) -> int:
+    """Map a y coordinate to a list item index, or -1 if it hits no item."""
+    index = (py - top) // item_height + scroll_offset
+    return index if 0 <= index < n_items else -1
 
 
 class ListItem:
     """An item in a list component."""
 
+    __slots__ = ('label', 'value')
+
     def __init__(self, label: str, value: Optional[str] = None):
         self.label = label
         self.value = value if value is not None else label
@@ -524,6 +728,14 @@ class ListBox(Component):
     A list box component showing selectable items.
     """
 
+    __slots__ = (
+        '_items', '_selected_index', '_hover_index', '_on_select',
+        '_item_height', '_scroll_offset',
+    )
+
+    # Row height, scaled for platform once at import
+    DEFAULT_ITEM_HEIGHT = 30 * PLATFORM_SCALE
+
     def __init__(
         self,
         x: int, y: int,
@@ -532,14 +744,11 @@ class ListBox(Component):
         on_select: Optional[Callable[[int, str], None]] = None
     ):
         super().__init__(x, y, width, height)
-        self._items: List[ListItem] = []
-        if items:
-            for item in items:
-                self._items.append(ListItem(item))
+        self._items: List[ListItem] = [ListItem(item) for item in items] if items else []
         self._selected_index = -1
         self._hover_index = -1
         self._on_select = on_select
-        self._item_height = 30 * PLATFORM_SCALE  # Scaled for platform
+        self._item_height = self.DEFAULT_ITEM_HEIGHT
         self._scroll_offset = 0
 
     @property
@@ -573,6 +782,10 @@ class ListBox(Component):
         """Add an item to the list."""
         self._items.append(ListItem(label, value))
 
+    def add_items(self, labels: List[str]) -> None:
+        """Add several items (label doubling as value) in one call."""
+        self._items.extend([ListItem(label) for label in labels])
+
     def select_index(self, index: int) -> None:
         """Select an item by index."""
         if 0 <= index < len(self._items):
@@ -583,25 +796,40 @@ class ListBox(Component):
 
     def _get_item_index_at(self, py: int) -> int:
         """Get the item index at a given y position."""
-        rel_y = py - self.y
-        index = rel_y // self._item_height + self._scroll_offset
-        if 0 <= index < len(self._items):
-            return index
-        return -1
+        return _listbox_index(
+            py, self._bounds.y, self._item_height, self._scroll_offset, len(self._items)
+        )
 
-    def on_click(self, px: int, py: int) -> None:
+    def get_item_indices_at(self, pys: List[int]) -> List[int]:
+        """
+        Get the item index (or -1) for each of a batch of y positions.
+
+        Lets buffered pointer motion be resolved in one call, with the
+        list geometry looked up once.
+        """
+        top = self._bounds.y
+        item_height = self._item_height
+        scroll_offset = self._scroll_offset
+        n_items = len(self._items)
+        return [_listbox_index(py, top, item_height, scroll_offset, n_items) for py in pys]
+
+    def _click_at(self, px: int, py: int) -> None:
         """Handle click - select item at position."""
-        if self._enabled and self.contains_point(px, py):
-            index = self._get_item_index_at(py)
-            if index >= 0:
-                self.select_index(index)
-
-    def update_hover(self, px: int, py: int) -> None:
-        """Update hover state based on mouse position."""
-        if self.contains_point(px, py):
-            self._hover_index = self._get_item_index_at(py)
-        else:
-            self._hover_index = -1
+        index = self._get_item_index_at(py)
+        if index >= 0:
+            self.select_index(index)
+
+    def update_hover(self, px: int, py: int) -> bool:
+        """
+        Update hover state based on mouse position.
+
+        Returns True if the hovered item changed.
+        """
+        index = self._get_item_index_at(py) if self.contains_point(px, py) else -1
+        if index != self._hover_index:
+            self._hover_index = index
+            return True
+        return False
 
 
 class ImageDisplay(Component):
@@ -611,6 +839,11 @@ class ImageDisplay(Component):
     Supports power-of-two pixel-perfect zoom levels.
     """
 
+    __slots__ = (
+        '_image_path', '_zoom_level', '_on_zoom', '_image_data', '_rgb_bytes',
+        '_indexed_data', '_color_map', '_image_width', '_image_height',
+    )
+
     # Zoom levels as powers of 2 (negative = zoom out, positive = zoom in)
     # -2 = 1/4, -1 = 1/2, 0 = 1x, 1 = 2x, 2 = 4x
     MIN_ZOOM_LEVEL = -2
@@ -628,6 +861,7 @@ class ImageDisplay(Component):
         self._zoom_level = 0  # 0 = 1x, 1 = 2x, -1 = 0.5x, etc.
         self._on_zoom = on_zoom
         self._image_data: Optional[List[List[Tuple[int, int, int]]]] = None
+        self._rgb_bytes: Optional[bytes] = None  # Raw pixels backing image_data
         self._indexed_data: Optional[List[List[int]]] = None  # Cached palette-indexed version
         self._color_map: Optional[dict] = None  # RGB tuple -> palette index mapping
         self._image_width = 0
@@ -650,21 +884,23 @@ class ImageDisplay(Component):
             self._image_width = img.width
             self._image_height = img.height
 
-            # Store as 2D array of RGB tuples and collect unique colors
-            self._image_data = []
-            unique_colors: set = set()
-            for y in range(img.height):
-                row = []
-                for x in range(img.width):
-                    pixel = img.getpixel((x, y))
-                    row.append(pixel)
-                    unique_colors.add(pixel)
-                self._image_data.append(row)
+            # Keep the raw RGB bytes (3 per pixel) rather than a tuple per
+            # pixel; image_data builds the tuple rows only if asked for
+            self._rgb_bytes = img.tobytes()
+            self._image_data = None
+
+            # Index the image up front with map(dict.get); the RGB tuples
+            # zip builds are dropped as they are mapped, so none are kept
+            colors = [color for _, color in img.getcolors(maxcolors=img.width * img.height or 1)]
 
             # Register unique colors with the palette and store the mapping
-            self._color_map = register_image_colors(list(unique_colors))
-            # Clear cached indexed data since we have new color mapping
-            self._indexed_data = None
+            self._color_map = color_map = register_image_colors(colors)
+            channels = iter(self._rgb_bytes)
+            flat = list(map(color_map.get, zip(channels, channels, channels)))
+            width = img.width
+            self._indexed_data = [
+                flat[start:start + width] for start in range(0, len(flat), width)
+            ]
 
             return True
         except Exception:
@@ -684,9 +920,22 @@ class ImageDisplay(Component):
         """Get the actual zoom factor (e.g., 0.5, 1.0, 2.0, 4.0)."""
         return 2 ** self._zoom_level
 
+    @property
+    def has_image(self) -> bool:
+        """Whether an image has been loaded."""
+        return self._rgb_bytes is not None
+
     @property
     def image_data(self) -> Optional[List[List[Tuple[int, int, int]]]]:
-        """Get the raw image data as RGB tuples."""
+        """Get the raw image data as RGB tuples (built on first access)."""
+        if self._image_data is None and self._rgb_bytes is not None:
+            width = self._image_width
+            channels = iter(self._rgb_bytes)
+            pixels = list(zip(channels, channels, channels))
+            self._image_data = [
+                pixels[start:start + width]
+                for start in range(0, len(pixels), width)
+            ]
         return self._image_data
 
     @property
@@ -738,12 +987,8 @@ class ImageDisplay(Component):
             return True
         return False
 
-    def on_click(self, px: int, py: int) -> None:
-        """ImageDisplay doesn't respond to clicks directly."""
-        pass
-
 
-@dataclass
+@dataclass(slots=True)
 class Window:
     """
     A window container that holds components.
@@ -755,22 +1000,64 @@ class Window:
     height: int
     components: List[Component] = field(default_factory=list)
     active: bool = False
+    # Position in GUIState.windows, set by add_window
+    _index: int = field(default=-1, init=False, repr=False, compare=False)
+    # Index of the selected component among the window's interactive ones
+    _focused_component_index: int = field(default=0, init=False, repr=False, compare=False)
+    # Hit-test index over components, rebuilt lazily when components change
+    _hit_index: Optional[Quadtree] = field(default=None, init=False, repr=False, compare=False)
+    _hit_index_count: int = field(default=0, init=False, repr=False, compare=False)
+    # Last component hit, reused while the pointer stays on it; only
+    # components no later component overlaps are cached
+    _last_hit: Optional[Component] = field(default=None, init=False, repr=False, compare=False)
+    _occluded: set = field(default_factory=set, init=False, repr=False, compare=False)
+    # Interactive (enabled, focusable) components, with the
+    # (component count, enabled generation) they were filtered at
+    _interactive_cache: Optional[List[Component]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _interactive_key: tuple = field(default=(), init=False, repr=False, compare=False)
+    # Right/bottom edges (windows are not moved once created)
+    _x2: int = field(default=0, init=False, repr=False, compare=False)
+    _y2: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._x2 = self.x + self.width
+        self._y2 = self.y + self.height
 
     def add_component(self, component: Component) -> None:
         """Add a component to this window."""
         self.components.append(component)
+        self._hit_index = None
+        self._last_hit = None
+        self._interactive_cache = None
 
     def contains_point(self, px: int, py: int) -> bool:
         """Check if a point is within this window."""
-        return (self.x <= px < self.x + self.width and
-                self.y <= py < self.y + self.height)
+        return self.x <= px < self._x2 and self.y <= py < self._y2
 
     def get_component_at(self, px: int, py: int) -> Optional[Component]:
-        """Get the component at a given position."""
-        for component in reversed(self.components):
-            if component.visible and component.contains_point(px, py):
-                return component
-        return None
+        """Get the topmost visible component at a given position."""
+        index = self._hit_index
+        if index is None or self._hit_index_count != len(self.components):
+            index = self._hit_index = Quadtree.build(
+                [(c.x, c.y, c.width, c.height, c) for c in self.components]
+            )
+            self._hit_index_count = len(self.components)
+            self._occluded = index.occluded_items()
+            self._last_hit = None
+        else:
+            # Pointer motion mostly stays on the same component
+            last = self._last_hit
+            if last is not None and last._visible and last._bounds.contains(px, py):
+                return last
+        best: Optional[Component] = None
+        best_order = -1
+        for order, component in index.query_point(px, py):
+            if order > best_order and component.visible:
+                best, best_order = component, order
+        if best is not None and best not in self._occluded:
+            self._last_hit = best
+        return best
 
 
 class GUIState:
@@ -786,31 +1073,62 @@ class GUIState:
     def __init__(self):
         self.windows: List[Window] = []
         self._focused_window_index: int = -1
-        self._component_index_per_window: dict = {}  # window -> index of selected component
-        self._dirty_windows: set = set()  # Set of window indices that need redraw
+        self._dirty_mask: int = 0  # Bit i set when window i needs redraw
         self._full_redraw_needed: bool = True  # Initial full redraw
+        self._dirty_version: int = 0  # Bumped on every visible state change
+        # (dirty_version, window, component count, focused component,
+        # enabled generation); see get_focused_component
+        self._focus_cache: Optional[tuple] = None
+        # What _update_focus_visuals last marked, so it can undo just that
+        self._last_focused: Optional[Component] = None
+        self._last_active_window: Optional[Window] = None
+        # Components that took focus from a click (e.g. TextInput), which
+        # clear_focus must also reset
+        self._click_focused: set = set()
+        # Hit-test index over windows (windows are not moved once added)
+        self._window_index: Optional[Quadtree] = None
+        self._window_index_count = 0
+
+    @property
+    def dirty_version(self) -> int:
+        """Monotonic counter incremented whenever visible state changes."""
+        return self._dirty_version
 
     def mark_dirty(self, window_index: Optional[int] = None) -> None:
         """Mark a window as needing redraw, or all windows if index is None."""
+        self._dirty_version += 1
         if window_index is None:
             self._full_redraw_needed = True
         else:
-            self._dirty_windows.add(window_index)
+            self._dirty_mask |= 1 << window_index
+
+    def mark_window_dirty(self, window: Window, bump_version: bool = True) -> None:
+        """
+        Mark a window added to this GUI as needing redraw.
+
+        Pass bump_version=False when the change already reaches the app
+        loop another way (e.g. an animation callback returning True), so
+        one change doesn't trigger two renders.
+        """
+        if bump_version:
+            self._dirty_version += 1
+        self._dirty_mask |= 1 << window._index
 
     def get_dirty_windows(self) -> List[int]:
         """Get list of window indices that need redraw."""
         if self._full_redraw_needed:
             return list(range(len(self.windows)))
-        return list(self._dirty_windows)
+        mask = self._dirty_mask
+        return [i for i in range(mask.bit_length()) if mask >> i & 1]
 
     def clear_dirty(self) -> None:
         """Clear all dirty flags."""
-        self._dirty_windows.clear()
+        self._dirty_mask = 0
         self._full_redraw_needed = False
 
     def is_dirty(self) -> bool:
         """Check if any window needs redraw."""
-        return self._full_redraw_needed or len(self._dirty_windows) > 0
+        return self._full_redraw_needed or self._dirty_mask != 0
 
     def needs_full_redraw(self) -> bool:
         """Check if a full redraw is needed."""
@@ -818,14 +1136,30 @@ class GUIState:
 
     def add_window(self, window: Window) -> None:
         """Add a window to the GUI."""
+        window._index = len(self.windows)
         self.windows.append(window)
-        # Initialize component index for this window (select first interactive component)
-        self._component_index_per_window[id(window)] = 0
+        self._dirty_version += 1
+        self._window_index = None
+        # Select the window's first interactive component
+        window._focused_component_index = 0
 
     def _get_interactive_components(self, window: Window) -> List[Component]:
-        """Get list of interactive components in a window."""
-        return [c for c in window.components
-                if c.enabled and not isinstance(c, ProgressBar)]
+        """
+        Get list of interactive components in a window.
+
+        Cached on the window until a component is added or any component
+        is enabled or disabled. Callers must not modify the returned list.
+        """
+        key = (len(window.components), Component._enabled_generation)
+        cached = window._interactive_cache
+        if cached is not None and window._interactive_key == key:
+            return cached
+        cached = window._interactive_cache = [
+            c for c in window.components
+            if c._enabled and c.is_interactive
+        ]
+        window._interactive_key = key
+        return cached
 
     def get_focused_window(self) -> Optional[Window]:
         """Get the currently focused window."""
@@ -834,40 +1168,73 @@ class GUIState:
         return None
 
     def get_focused_component(self) -> Optional[Component]:
-        """Get the currently focused component within the focused window."""
+        """
+        Get the currently focused component within the focused window.
+
+        The result is cached until the next GUIState change, a change in the
+        window's component count, or a component being enabled or disabled.
+        """
         window = self.get_focused_window()
         if not window:
             return None
+        cache = self._focus_cache
+        count = len(window.components)
+        if (cache is not None and cache[0] == self._dirty_version
+                and cache[1] is window and cache[2] == count
+                and cache[4] == Component._enabled_generation):
+            return cache[3]
+
         components = self._get_interactive_components(window)
-        if not components:
-            return None
-        idx = self._component_index_per_window.get(id(window), 0)
-        if 0 <= idx < len(components):
-            return components[idx]
-        return components[0] if components else None
+        component: Optional[Component] = None
+        if components:
+            idx = window._focused_component_index
+            component = components[idx] if 0 <= idx < len(components) else components[0]
+        self._focus_cache = (
+            self._dirty_version, window, count, component, Component._enabled_generation
+        )
+        return component
 
     def clear_focus(self) -> None:
         """Remove focus from all components."""
-        for window in self.windows:
-            window.active = False
-            for component in window.components:
-                if component.state == ComponentState.FOCUSED:
-                    component.state = ComponentState.NORMAL
+        self._dirty_version += 1
+        focused, normal = ComponentState.FOCUSED, ComponentState.NORMAL
+        # Only components this state focused can be focused, so reset
+        # those rather than sweeping every window. They stay tracked so
+        # the next focus move blurs any TextInput among them.
+        previous = self._last_focused
+        if previous is not None and previous._state is focused:
+            previous._state = normal
+        for component in self._click_focused:
+            if component._state is focused:
+                component._state = normal
+        if self._last_active_window is not None:
+            self._last_active_window.active = False
+            self._last_active_window = None
 
     def _update_focus_visuals(self) -> None:
-        """Update visual focus indicators."""
-        # Clear all focus
-        for window in self.windows:
-            window.active = False
-            for component in window.components:
-                if component.state == ComponentState.FOCUSED:
-                    component.state = ComponentState.NORMAL
-                # Also blur TextInputs
-                if isinstance(component, TextInput) and component.has_focus:
-                    component.blur()
+        """
+        Update visual focus indicators.
+
+        Only the previously focused window and component, plus anything
+        focused by a click since, are reset, so a focus move costs O(1)
+        rather than a sweep over every component.
+        """
+        # Called after every focus move, before the version bump
+        self._focus_cache = None
+
+        # Clear the previous focus
+        previous = self._last_focused
+        if previous is not None:
+            _unfocus(previous)
+        for component in self._click_focused:
+            _unfocus(component)
+        self._click_focused.clear()
+        if self._last_active_window is not None:
+            self._last_active_window.active = False
 
         # Set focus on current window and component
         window = self.get_focused_window()
+        component = None
         if window:
             window.active = True
             component = self.get_focused_component()
@@ -876,30 +1243,36 @@ class GUIState:
                 # Also focus TextInputs so they accept typing
                 if isinstance(component, TextInput):
                     component.focus()
+        self._last_active_window = window
+        self._last_focused = component
 
     def focus_next(self) -> None:
         """Move focus to the next window."""
-        if not self.windows:
-            return
-        old_index = self._focused_window_index
-        self._focused_window_index = (self._focused_window_index + 1) % len(self.windows)
-        self._update_focus_visuals()
-        # Mark both old and new windows as dirty
-        if old_index >= 0:
-            self._dirty_windows.add(old_index)
-        self._dirty_windows.add(self._focused_window_index)
+        self._move_window_focus(1)
 
     def focus_previous(self) -> None:
         """Move focus to the previous window."""
-        if not self.windows:
+        self._move_window_focus(-1)
+
+    def _move_window_focus(self, step: int) -> None:
+        """Cycle window focus by step, marking the old and new windows dirty."""
+        n_windows = len(self.windows)
+        if not n_windows:
             return
         old_index = self._focused_window_index
-        self._focused_window_index = (self._focused_window_index - 1) % len(self.windows)
+        if (n_windows == 1 and old_index == 0
+                and self._last_active_window is self.windows[0]
+                and not self._click_focused):
+            # A lone window that is already focused would cycle to itself;
+            # a click-focused component still needs the refresh to blur it
+            return
+        self._focused_window_index = (old_index + step) % n_windows
+        self._dirty_version += 1
         self._update_focus_visuals()
         # Mark both old and new windows as dirty
         if old_index >= 0:
-            self._dirty_windows.add(old_index)
-        self._dirty_windows.add(self._focused_window_index)
+            self._dirty_mask |= 1 << old_index
+        self._dirty_mask |= 1 << self._focused_window_index
 
     def activate_focused(self) -> bool:
         """
@@ -912,28 +1285,15 @@ class GUIState:
             return False
 
         # Mark current window as dirty
+        self._dirty_version += 1
         if self._focused_window_index >= 0:
-            self._dirty_windows.add(self._focused_window_index)
-
-        # Handle different component types
-        if isinstance(component, Button):
-            component.toggle()
-            return True
-        elif isinstance(component, Checkbox):
-            component.toggle()
-            return True
-        elif isinstance(component, RadioButton):
-            component.select()
-            return True
-        elif isinstance(component, TextInput):
-            # Focus text input for typing
-            if hasattr(component, 'focus'):
-                component.focus()
-            return True
-        elif isinstance(component, ListBox):
-            return True
+            self._dirty_mask |= 1 << self._focused_window_index
 
-        return False
+        handler = _resolve_handler(_ACTIVATE_HANDLERS, type(component))
+        if handler is None:
+            return False
+        handler(component)
+        return True
 
     def handle_key(self, key: str) -> bool:
         """
@@ -946,122 +1306,144 @@ class GUIState:
             if len(key) == 1 and key.isprintable():
                 component.insert_char(key)
                 # Mark current window as dirty
+                self._dirty_version += 1
                 if self._focused_window_index >= 0:
-                    self._dirty_windows.add(self._focused_window_index)
+                    self._dirty_mask |= 1 << self._focused_window_index
                 return True
         return False
 
-    def handle_special_key(self, key_name: str) -> bool:
+    def handle_special_key(self, key_name: str, count: int = 1) -> bool:
         """
         Handle arrow keys and other special keys within the focused window.
 
+        count applies a run of identical presses (e.g. key auto-repeat) in
+        one call, stopping early once the key stops having an effect; the
+        window is marked dirty once for the whole run.
+
         Returns True if the key was handled.
         """
         window = self.get_focused_window()
         if not window:
             return False
 
-        component = self.get_focused_component()
+        # Both lookups are cached, and the component lookup reuses the
+        # filtered list on a miss, so fetch the list first
         components = self._get_interactive_components(window)
-
         if not components:
             return False
 
-        current_idx = self._component_index_per_window.get(id(window), 0)
         handled = False
+        start_idx = window._focused_component_index
+        for _ in range(count):
+            # Focus may move between presses, so look the component up each time
+            component = self.get_focused_component()
+            handler = _resolve_handler(_SPECIAL_KEY_HANDLERS, type(component))
+            if handler is None or not handler(self, window, component, components, key_name):
+                break
+            handled = True
 
-        # TextInput: handle backspace and left/right cursor movement
-        if isinstance(component, TextInput):
-            if key_name == 'backspace':
-                component.delete_char()
-                handled = True
-            elif key_name == 'left':
-                component.move_cursor_left()
-                handled = True
-            elif key_name == 'right':
-                component.move_cursor_right()
-                handled = True
-            elif key_name in ('up', 'down'):
-                # Move to prev/next component in window
-                if key_name == 'up' and current_idx > 0:
-                    self._component_index_per_window[id(window)] = current_idx - 1
-                    self._update_focus_visuals()
-                    handled = True
-                elif key_name == 'down' and current_idx < len(components) - 1:
-                    self._component_index_per_window[id(window)] = current_idx + 1
-                    self._update_focus_visuals()
-                    handled = True
-
-        # Slider: left/right to adjust value
-        elif isinstance(component, Slider):
-            if key_name == 'left':
-                step = (component.max_value - component.min_value) / 20
-                component.value = max(component.min_value, component.value - step)
-                handled = True
-            elif key_name == 'right':
-                step = (component.max_value - component.min_value) / 20
-                component.value = min(component.max_value, component.value + step)
-                handled = True
-            elif key_name in ('up', 'down'):
-                # Move to prev/next slider
-                if key_name == 'up' and current_idx > 0:
-                    self._component_index_per_window[id(window)] = current_idx - 1
-                    self._update_focus_visuals()
-                    handled = True
-                elif key_name == 'down' and current_idx < len(components) - 1:
-                    self._component_index_per_window[id(window)] = current_idx + 1
-                    self._update_focus_visuals()
-                    handled = True
-
-        # ImageDisplay: up/right to zoom in, down/left to zoom out
-        elif isinstance(component, ImageDisplay):
-            if key_name in ('up', 'right'):
-                component.zoom_in()
-                handled = True
-            elif key_name in ('down', 'left'):
-                component.zoom_out()
-                handled = True
-
-        # RadioButton, Checkbox, Button, ListBox: up/down to move between items
-        elif isinstance(component, (RadioButton, Checkbox, Button, ListBox)):
-            if key_name == 'up' and current_idx > 0:
-                self._component_index_per_window[id(window)] = current_idx - 1
-                self._update_focus_visuals()
-                # For radio buttons, also select the new one
-                new_component = components[current_idx - 1]
-                if isinstance(new_component, RadioButton):
-                    new_component.select()
-                handled = True
-            elif key_name == 'down' and current_idx < len(components) - 1:
-                self._component_index_per_window[id(window)] = current_idx + 1
-                self._update_focus_visuals()
-                # For radio buttons, also select the new one
-                new_component = components[current_idx + 1]
-                if isinstance(new_component, RadioButton):
-                    new_component.select()
-                handled = True
-            # ListBox also handles internal selection
-            if not handled and isinstance(component, ListBox):
-                if key_name == 'up' and component.selected_index > 0:
-                    component.select_index(component.selected_index - 1)
-                    handled = True
-                elif key_name == 'down' and component.selected_index < len(component.items) - 1:
-                    component.select_index(component.selected_index + 1)
-                    handled = True
+        # Focus moves only update the index; refresh the highlights once
+        # for the whole run
+        if window._focused_component_index != start_idx:
+            self._update_focus_visuals()
 
         # Mark current window as dirty if handled
-        if handled and self._focused_window_index >= 0:
-            self._dirty_windows.add(self._focused_window_index)
+        if handled:
+            self._dirty_version += 1
+            self._dirty_mask |= 1 << self._focused_window_index
 
         return handled
 
+    def _move_focus_within(self, window: Window, components: List[Component],
+                           key_name: str) -> Optional[Component]:
+        """
+        Move focus up/down between a window's interactive components.
+
+        Returns the newly focused component, or None if focus didn't move.
+        Focus visuals are left to handle_special_key.
+        """
+        current_idx = window._focused_component_index
+        if key_name == 'up' and current_idx > 0:
+            new_idx = current_idx - 1
+        elif key_name == 'down' and current_idx < len(components) - 1:
+            new_idx = current_idx + 1
+        else:
+            return None
+        window._focused_component_index = new_idx
+        self._focus_cache = None
+        return components[new_idx]
+
+    def _text_input_key(self, window: Window, component: "TextInput",
+                        components: List[Component], key_name: str) -> bool:
+        """TextInput: backspace, left/right cursor movement, up/down to move."""
+        if key_name == 'backspace':
+            component.delete_char()
+            return True
+        if key_name == 'left':
+            component.move_cursor_left()
+            return True
+        if key_name == 'right':
+            component.move_cursor_right()
+            return True
+        return self._move_focus_within(window, components, key_name) is not None
+
+    def _slider_key(self, window: Window, component: "Slider",
+                    components: List[Component], key_name: str) -> bool:
+        """Slider: left/right to adjust value, up/down to move between sliders."""
+        # The value setter clamps to the slider's range
+        direction = _SLIDER_DIRECTIONS.get(key_name)
+        if direction is not None:
+            component.value = component._value + direction * component._step
+            return True
+        return self._move_focus_within(window, components, key_name) is not None
+
+    def _image_display_key(self, window: Window, component: "ImageDisplay",
+                           components: List[Component], key_name: str) -> bool:
+        """ImageDisplay: up/right to zoom in, down/left to zoom out."""
+        # Zoom is applied when the frame is drawn, so a run of presses costs
+        # one redraw; a press at the zoom limit is unhandled, ending the run
+        if key_name in ('up', 'right'):
+            return component.zoom_in()
+        if key_name in ('down', 'left'):
+            return component.zoom_out()
+        return False
+
+    def _item_key(self, window: Window, component: Component,
+                  components: List[Component], key_name: str) -> bool:
+        """RadioButton, Checkbox, Button: up/down to move between items."""
+        new_component = self._move_focus_within(window, components, key_name)
+        if new_component is None:
+            return False
+        # Moving onto a radio button also selects it
+        if isinstance(new_component, RadioButton):
+            new_component.select()
+        return True
+
+    def _listbox_key(self, window: Window, component: Component,
+                     components: List[Component], key_name: str) -> bool:
+        """ListBox: up/down moves focus, else steps the internal selection."""
+        if self._item_key(window, component, components, key_name):
+            return True
+        index = component._selected_index
+        if key_name == 'up' and index > 0:
+            component.select_index(index - 1)
+            return True
+        if key_name == 'down' and index < len(component._items) - 1:
+            component.select_index(index + 1)
+            return True
+        return False
+
     # Legacy methods for compatibility
     def get_window_at(self, px: int, py: int) -> Optional[Window]:
-        """Get the window at a given position."""
-        for window in reversed(self.windows):
-            if window.contains_point(px, py):
-                return window
-        return None
+        """Get the topmost window at a given position."""
+        index = self._window_index
+        if index is None or self._window_index_count != len(self.windows):
+            index = self._window_index = Quadtree.build(
+                [(w.x, w.y, w.width, w.height, w) for w in self.windows]
+            )
+            self._window_index_count = len(self.windows)
+        hits = index.query_point(px, py)
+        return max(hits, key=lambda hit: hit[0])[1] if hits else None
 
     def get_component_at(self, px: int, py: int) -> Optional[Component]:
         """Get the component at a given position."""
@@ -1074,10 +1456,63 @@ class GUIState:
         """Handle a click at the given position."""
         component = self.get_component_at(px, py)
         if component and component.enabled:
-            component.on_click(px, py)
+            # get_component_at has already hit-tested the component
+            component._click_at(px, py)
+            if component._state is ComponentState.FOCUSED:
+                self._click_focused.add(component)
             return component
         return None
 
     @property
     def focused_component(self) -> Optional[Component]:
         return self.get_focused_component()
+
+
+def _resolve_handler(table: dict, cls: type) -> Optional[Callable]:
+    """
+    Look up a per-type handler by exact type, falling back to the MRO.
+
+    Subclass hits are cached in the table, so each type walks its MRO once.
+    """
+    handler = table.get(cls)
+    if handler is None and cls not in table:
+        handler = next((table[base] for base in cls.__mro__[1:] if base in table), None)
+        table[cls] = handler
+    return handler
+
+
+def _unfocus(component: Component) -> None:
+    """Reset a focused component, blurring TextInputs."""
+    if component._state is ComponentState.FOCUSED:
+        component._state = ComponentState.NORMAL
+    if isinstance(component, TextInput) and component.has_focus:
+        component.blur()
+
+
+def _no_action(component: Component) -> None:
+    """Activation that only marks the window dirty (e.g. ListBox)."""
+
+
+# Component type -> activation action (see GUIState.activate_focused);
+# methodcaller keeps subclass overrides working
+_ACTIVATE_HANDLERS: dict = {
+    Button: methodcaller('toggle'),
+    Checkbox: methodcaller('toggle'),
+    RadioButton: methodcaller('select'),
+    TextInput: methodcaller('focus'),  # Focus text input for typing
+    ListBox: _no_action,
+}
+
+# Component type -> special key handler (see GUIState.handle_special_key)
+_SPECIAL_KEY_HANDLERS: dict = {
+    TextInput: GUIState._text_input_key,
+    Slider: GUIState._slider_key,
+    ImageDisplay: GUIState._image_display_key,
+    RadioButton: GUIState._item_key,
+    Checkbox: GUIState._item_key,
+    Button: GUIState._item_key,
+    ListBox: GUIState._listbox_key,
+}
+
+# Arrow key -> sign of the slider step (see GUIState._slider_key)
+_SLIDER_DIRECTIONS: dict = {'left': -1, 'right': 1}
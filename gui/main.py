@@ -18,6 +18,7 @@ Requirements:
 
 import sys
 from pathlib import Path
+from typing import List
 
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -42,6 +43,52 @@ from config import build_gui_from_config, apply_bindings, PLATFORM_SCALE
 from sixel import IS_ITERM2
 
 
+# Demo layout, one entry per window in row-major order (4 per row). Each
+# entry is (title, component class, first y offset below the title bar,
+# y step between components, horizontal inset, component height, kwargs
+# for each component). Lengths are unscaled pixels.
+_DEMO_WINDOWS = (
+    ("BUTTONS", Button, 15, 53, 30, 42, (
+        {"label": "PRIMARY"},
+        {"label": "SECONDARY"},
+        {"label": "DISABLED", "enabled": False},
+    )),
+    ("CHECKBOXES", Checkbox, 15, 45, 30, 36, (
+        {"label": "OPTION A", "checked": True},
+        {"label": "OPTION B", "checked": False},
+        {"label": "OPTION C", "checked": True},
+    )),
+    ("RADIO", RadioButton, 15, 45, 30, 36, (
+        {"label": "SMALL", "selected": True},
+        {"label": "MEDIUM"},
+        {"label": "LARGE"},
+    )),
+    ("TEXT INPUT", TextInput, 15, 57, 30, 42, (
+        {"placeholder": "NAME...", "max_length": 100},
+        {"placeholder": "EMAIL...", "max_length": 100},
+        {"placeholder": "PASSWORD...", "max_length": 100},
+    )),
+    ("SLIDERS", Slider, 22, 52, 75, 30, (
+        {"min_value": 0, "max_value": 100, "value": 25},
+        {"min_value": 0, "max_value": 100, "value": 50},
+        {"min_value": 0, "max_value": 100, "value": 75},
+    )),
+    ("PROGRESS", ProgressBar, 22, 52, 30, 36, (
+        {"value": 100, "max_value": 100},
+        {"value": 65, "max_value": 100},
+        {"value": 25, "max_value": 100},
+    )),
+    ("LIST", ListBox, 15, 0, 30, 150, (
+        {"items": ["ITEM 1", "ITEM 2", "ITEM 3", "ITEM 4", "ITEM 5"]},
+    )),
+    ("IMAGE", ImageDisplay, 15, 0, 30, 150, (
+        {"image_path": "squirel.png"},
+    )),
+)
+
+_DEMO_DIR = Path(__file__).parent / "demo"
+
+
 def create_demo_gui() -> GUIState:
     """Create the demo GUI with 8 windows showcasing different components."""
     gui = GUIState()
@@ -55,299 +102,55 @@ def create_demo_gui() -> GUIState:
     start_y = 15 * scale
     title_bar_height = 36 * scale
 
-    # Common scaled dimensions
-    padding = 15 * scale
-    btn_height = 42 * scale
-    cb_height = 36 * scale
-    slider_height = 30 * scale
-    listbox_height = 150 * scale
-
-    # ============================================================
-    # Window 1: Buttons
-    # ============================================================
-    btn_window = Window(
-        title="BUTTONS",
-        x=start_x,
-        y=start_y,
-        width=window_width,
-        height=window_height
-    )
-
-    # Primary button
-    btn_window.add_component(Button(
-        x=start_x + padding,
-        y=start_y + title_bar_height + padding,
-        width=window_width - 2 * padding,
-        height=btn_height,
-        label="PRIMARY"
-    ))
-
-    # Secondary button
-    btn_window.add_component(Button(
-        x=start_x + padding,
-        y=start_y + title_bar_height + 68 * scale,
-        width=window_width - 2 * padding,
-        height=btn_height,
-        label="SECONDARY"
-    ))
-
-    # Disabled button
-    disabled_btn = Button(
-        x=start_x + padding,
-        y=start_y + title_bar_height + 121 * scale,
-        width=window_width - 2 * padding,
-        height=btn_height,
-        label="DISABLED"
-    )
-    disabled_btn.enabled = False
-    btn_window.add_component(disabled_btn)
-
-    gui.add_window(btn_window)
-
-    # ============================================================
-    # Window 2: Checkboxes
-    # ============================================================
-    cb_window = Window(
-        title="CHECKBOXES",
-        x=start_x + window_width + window_gap,
-        y=start_y,
-        width=window_width,
-        height=window_height
-    )
-
-    cb_x = cb_window.x + padding
-    cb_y_start = cb_window.y + title_bar_height + padding
-
-    cb_window.add_component(Checkbox(
-        x=cb_x, y=cb_y_start,
-        width=window_width - 2 * padding, height=cb_height,
-        label="OPTION A",
-        checked=True
-    ))
-
-    cb_window.add_component(Checkbox(
-        x=cb_x, y=cb_y_start + 45 * scale,
-        width=window_width - 2 * padding, height=cb_height,
-        label="OPTION B",
-        checked=False
-    ))
-
-    cb_window.add_component(Checkbox(
-        x=cb_x, y=cb_y_start + 90 * scale,
-        width=window_width - 2 * padding, height=cb_height,
-        label="OPTION C",
-        checked=True
-    ))
-
-    gui.add_window(cb_window)
-
-    # ============================================================
-    # Window 3: Radio Buttons
-    # ============================================================
-    radio_window = Window(
-        title="RADIO",
-        x=start_x + 2 * (window_width + window_gap),
-        y=start_y,
-        width=window_width,
-        height=window_height
-    )
-
-    radio_group = RadioGroup()
-    radio_x = radio_window.x + padding
-    radio_y_start = radio_window.y + title_bar_height + padding
-
-    rb1 = RadioButton(
-        x=radio_x, y=radio_y_start,
-        width=window_width - 2 * padding, height=cb_height,
-        label="SMALL",
-        selected=True
-    )
-    radio_group.add_button(rb1)
-    radio_window.add_component(rb1)
-
-    rb2 = RadioButton(
-        x=radio_x, y=radio_y_start + 45 * scale,
-        width=window_width - 2 * padding, height=cb_height,
-        label="MEDIUM"
-    )
-    radio_group.add_button(rb2)
-    radio_window.add_component(rb2)
-
-    rb3 = RadioButton(
-        x=radio_x, y=radio_y_start + 90 * scale,
-        width=window_width - 2 * padding, height=cb_height,
-        label="LARGE"
-    )
-    radio_group.add_button(rb3)
-    radio_window.add_component(rb3)
-
-    gui.add_window(radio_window)
-
-    # ============================================================
-    # Window 4: Text Input
-    # ============================================================
-    input_window = Window(
-        title="TEXT INPUT",
-        x=start_x + 3 * (window_width + window_gap),
-        y=start_y,
-        width=window_width,
-        height=window_height
-    )
-
-    input_x = input_window.x + padding
-    input_y_start = input_window.y + title_bar_height + padding
-
-    input_window.add_component(TextInput(
-        x=input_x, y=input_y_start,
-        width=window_width - 2 * padding, height=btn_height,
-        placeholder="NAME...",
-        max_length=100
-    ))
-
-    input_window.add_component(TextInput(
-        x=input_x, y=input_y_start + 57 * scale,
-        width=window_width - 2 * padding, height=btn_height,
-        placeholder="EMAIL...",
-        max_length=100
-    ))
-
-    input_window.add_component(TextInput(
-        x=input_x, y=input_y_start + 114 * scale,
-        width=window_width - 2 * padding, height=btn_height,
-        placeholder="PASSWORD...",
-        max_length=100
-    ))
-
-    gui.add_window(input_window)
-
-    # ============================================================
-    # Window 5: Sliders (Row 2)
-    # ============================================================
-    row2_y = start_y + window_height + window_gap  # Second row y position
-
-    slider_window = Window(
-        title="SLIDERS",
-        x=start_x,
-        y=row2_y,
-        width=window_width,
-        height=window_height
-    )
-
-    slider_x = slider_window.x + padding
-    slider_y_start = slider_window.y + title_bar_height + 22 * scale
-
-    slider_window.add_component(Slider(
-        x=slider_x, y=slider_y_start,
-        width=window_width - 75 * scale, height=slider_height,
-        min_value=0, max_value=100, value=25
-    ))
-
-    slider_window.add_component(Slider(
-        x=slider_x, y=slider_y_start + 52 * scale,
-        width=window_width - 75 * scale, height=slider_height,
-        min_value=0, max_value=100, value=50
-    ))
-
-    slider_window.add_component(Slider(
-        x=slider_x, y=slider_y_start + 104 * scale,
-        width=window_width - 75 * scale, height=slider_height,
-        min_value=0, max_value=100, value=75
-    ))
-
-    gui.add_window(slider_window)
-
-    # ============================================================
-    # Window 6: Progress Bars (Row 2)
-    # ============================================================
-    progress_window = Window(
-        title="PROGRESS",
-        x=start_x + 1 * (window_width + window_gap),
-        y=row2_y,
-        width=window_width,
-        height=window_height
-    )
-
-    progress_x = progress_window.x + padding
-    progress_y_start = progress_window.y + title_bar_height + 22 * scale
-
-    progress_window.add_component(ProgressBar(
-        x=progress_x, y=progress_y_start,
-        width=window_width - 2 * padding, height=cb_height,
-        value=100, max_value=100
-    ))
-
-    progress_window.add_component(ProgressBar(
-        x=progress_x, y=progress_y_start + 52 * scale,
-        width=window_width - 2 * padding, height=cb_height,
-        value=65, max_value=100
-    ))
-
-    progress_window.add_component(ProgressBar(
-        x=progress_x, y=progress_y_start + 104 * scale,
-        width=window_width - 2 * padding, height=cb_height,
-        value=25, max_value=100
-    ))
-
-    gui.add_window(progress_window)
-
-    # ============================================================
-    # Window 7: List Box (Row 2)
-    # ============================================================
-    list_window = Window(
-        title="LIST",
-        x=start_x + 2 * (window_width + window_gap),
-        y=row2_y,
-        width=window_width,
-        height=window_height
-    )
-
-    list_x = list_window.x + padding
-    list_y_start = list_window.y + title_bar_height + padding
-
-    listbox = ListBox(
-        x=list_x, y=list_y_start,
-        width=window_width - 2 * padding, height=listbox_height,
-        items=["ITEM 1", "ITEM 2", "ITEM 3", "ITEM 4", "ITEM 5"]
-    )
-    listbox.select_index(0)
-    list_window.add_component(listbox)
-
-    gui.add_window(list_window)
-
-    # ============================================================
-    # Window 8: Image Display (Row 2)
-    # ============================================================
-    image_window = Window(
-        title="IMAGE",
-        x=start_x + 3 * (window_width + window_gap),
-        y=row2_y,
-        width=window_width,
-        height=window_height
-    )
-
-    image_x = image_window.x + padding
-    image_y_start = image_window.y + title_bar_height + padding
-
-    # Load the squirrel image
-    image_path = str(Path(__file__).parent / "demo" / "squirel.png")
-    image_display = ImageDisplay(
-        x=image_x, y=image_y_start,
-        width=window_width - 2 * padding, height=listbox_height,
-        image_path=image_path
-    )
-    image_window.add_component(image_display)
-
-    gui.add_window(image_window)
+    for index, (title, cls, top, step, inset, height, specs) in enumerate(_DEMO_WINDOWS):
+        row, col = divmod(index, 4)
+        window = Window(
+            title=title,
+            x=start_x + col * (window_width + window_gap),
+            y=start_y + row * (window_height + window_gap),
+            width=window_width,
+            height=window_height
+        )
+        x = window.x + 15 * scale
+        y = window.y + title_bar_height + top * scale
+        radio_group = RadioGroup() if cls is RadioButton else None
+
+        for spec in specs:
+            kwargs = dict(spec)
+            enabled = kwargs.pop("enabled", True)
+            if "image_path" in kwargs:
+                kwargs["image_path"] = str(_DEMO_DIR / kwargs["image_path"])
+            component = cls(
+                x=x, y=y,
+                width=window_width - inset * scale, height=height * scale,
+                **kwargs
+            )
+            if not enabled:
+                component.enabled = False
+            if radio_group is not None:
+                radio_group.add_button(component)
+            if cls is ListBox:
+                component.select_index(0)
+            window.add_component(component)
+            y += step * scale
+
+        gui.add_window(window)
 
     return gui
 
 
-def link_sliders_to_progress_bars(gui: GUIState):
-    """Link sliders to corresponding progress bars."""
+def link_sliders_to_progress_bars(gui: GUIState) -> List[bool]:
+    """
+    Link sliders to corresponding progress bars.
+
+    Returns a one-element flag that the sliders set whenever they move,
+    for create_sync_callback to pick up.
+    """
+    changed = [False]
     # Window 5 (index 4) has sliders
     # Window 6 (index 5) has progress bars
     if len(gui.windows) <= 5:
-        return
+        return changed
 
     slider_window = gui.windows[4]
     progress_window = gui.windows[5]
@@ -356,7 +159,7 @@ def link_sliders_to_progress_bars(gui: GUIState):
     progress_bars = [c for c in progress_window.components if isinstance(c, ProgressBar)]
 
     # Link each slider to corresponding progress bar
-    for i, (slider, progress) in enumerate(zip(sliders, progress_bars)):
+    for slider, progress in zip(sliders, progress_bars):
         # Set initial value
         progress.value = slider.value
 
@@ -364,35 +167,28 @@ def link_sliders_to_progress_bars(gui: GUIState):
         def make_callback(pb):
             def on_change(value):
                 pb.value = value
+                changed[0] = True
             return on_change
 
         slider._on_change = make_callback(progress)
 
+    return changed
 
-def create_sync_callback(gui: GUIState):
-    """Create a callback that syncs sliders to progress bars each frame."""
-    # Cache previous values to detect changes
-    prev_values = {}
-
-    def sync(delta_time: float) -> None:
-        # Sync slider values to progress bars
-        if len(gui.windows) > 5:
-            slider_window = gui.windows[4]
-            progress_window = gui.windows[5]
-
-            sliders = [c for c in slider_window.components if isinstance(c, Slider)]
-            progress_bars = [c for c in progress_window.components if isinstance(c, ProgressBar)]
 
-            changed = False
-            for i, (slider, progress) in enumerate(zip(sliders, progress_bars)):
-                if prev_values.get(i) != slider.value:
-                    progress.value = slider.value
-                    prev_values[i] = slider.value
-                    changed = True
+def create_sync_callback(gui: GUIState, changed: List[bool]):
+    """Create a callback that redraws the progress bars after a slider moves."""
 
-            # Only mark progress window dirty if values changed
-            if changed:
-                gui.mark_dirty(5)  # Progress window is at index 5
+    def sync(delta_time: float) -> bool:
+        # The slider callbacks have already copied the values across, so
+        # idle frames cost a single flag check
+        if not changed[0]:
+            return False
+        changed[0] = False
+        # Progress window is at index 5. The slider key has already bumped
+        # dirty_version and returning True bumps the animation version, so
+        # only the window's dirty bit is needed here.
+        gui.mark_window_dirty(gui.windows[5], bump_version=False)
+        return True
 
     return sync
 
@@ -418,8 +214,8 @@ def main():
     else:
         # Use built-in demo GUI
         gui = create_demo_gui()
-        link_sliders_to_progress_bars(gui)
-        sync_callback = create_sync_callback(gui)
+        sliders_changed = link_sliders_to_progress_bars(gui)
+        sync_callback = create_sync_callback(gui, sliders_changed)
 
         # Calculate dimensions for 2 rows of 4 windows (with platform scaling)
         # Each window is 240px wide with 15px gap (scaled on macOS)
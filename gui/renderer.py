@@ -54,6 +54,26 @@ from gui import (
 )
 
 
+def _button_colors(bg: str, border: str, text: str) -> Tuple[int, int, int]:
+    return COLOR_INDICES[bg], COLOR_INDICES[border], COLOR_INDICES[text]
+
+
+_BUTTON_NORMAL = _button_colors("button_bg", "button_border", "text")
+
+# Button (background, border, text) colors, indexed by ComponentState
+_BUTTON_COLORS: Tuple[Tuple[int, int, int], ...] = tuple(
+    {
+        ComponentState.DISABLED: _button_colors("button_bg", "button_border", "text_disabled"),
+        ComponentState.PRESSED: _button_colors("button_pressed", "accent", "text"),
+        ComponentState.HOVER: _button_colors("button_hover", "accent_hover", "text_highlight"),
+    }.get(state, _BUTTON_NORMAL)
+    for state in ComponentState
+)
+
+# Colors for a toggled-on button, whatever its state
+_BUTTON_TOGGLED = _button_colors("button_pressed", "accent", "text_highlight")
+
+
 class GUIRenderer:
     """
     Renders GUI state to sixel graphics.
@@ -95,7 +115,7 @@ class GUIRenderer:
         self._encode_frame = get_preferred_image_encoder()
         self._is_iterm2 = IS_ITERM2
 
-    def render_frame(self, gui_state: GUIState) -> str:
+    def render_frame(self, gui_state: GUIState) -> bytes:
         """
         Render the GUI state as a terminal graphics escape sequence.
 
@@ -106,7 +126,8 @@ class GUIRenderer:
             gui_state: The GUI state to render
 
         Returns:
-            Terminal escape sequence string (sixel or iTerm2)
+            Terminal escape sequence (sixel or iTerm2) as ASCII bytes,
+            ready to be written to the terminal without further encoding
         """
         # Clear and reuse pixel buffer
         clear_pixel_buffer(self._pixels, self._bg_color)
@@ -118,8 +139,8 @@ class GUIRenderer:
         # Draw instructions at bottom
         self._draw_instructions(self._pixels)
 
-        # Use the preferred encoder for this terminal
-        return self._encode_frame(self._pixels, self.width, self.height)
+        # Use the preferred encoder for this terminal; both emit pure ASCII
+        return self._encode_frame(self._pixels, self.width, self.height).encode('ascii')
 
     def get_window_rows(self, gui_state: GUIState) -> List[List[int]]:
         """
@@ -232,40 +253,15 @@ class GUIRenderer:
 
     def _get_button_colors(self, state: ComponentState) -> Tuple[int, int, int]:
         """Get background, border, and text colors for button state."""
-        if state == ComponentState.DISABLED:
-            return (
-                COLOR_INDICES["button_bg"],
-                COLOR_INDICES["button_border"],
-                COLOR_INDICES["text_disabled"]
-            )
-        elif state == ComponentState.PRESSED:
-            return (
-                COLOR_INDICES["button_pressed"],
-                COLOR_INDICES["accent"],
-                COLOR_INDICES["text"]
-            )
-        elif state == ComponentState.HOVER:
-            return (
-                COLOR_INDICES["button_hover"],
-                COLOR_INDICES["accent_hover"],
-                COLOR_INDICES["text_highlight"]
-            )
-        else:
-            return (
-                COLOR_INDICES["button_bg"],
-                COLOR_INDICES["button_border"],
-                COLOR_INDICES["text"]
-            )
+        return _BUTTON_COLORS[state]
 
     def _render_button(self, pixels: List[List[int]], button: Button) -> None:
         """Render a button component."""
         # Use pressed colors if button is toggled on
         if button.toggled:
-            bg_color = COLOR_INDICES["button_pressed"]
-            border_color = COLOR_INDICES["accent"]
-            text_color = COLOR_INDICES["text_highlight"]
+            bg_color, border_color, text_color = _BUTTON_TOGGLED
         else:
-            bg_color, border_color, text_color = self._get_button_colors(button.state)
+            bg_color, border_color, text_color = _BUTTON_COLORS[button.state]
 
         # Draw rounded rectangle
         draw_rounded_rect_filled(
@@ -356,7 +352,8 @@ class GUIRenderer:
         # Cursor blink: use blue color (input_focus) and slow blink
         cursor_visible = True
         if text_input.has_focus:
-            blink_phase = time.time() % (self._cursor_blink_interval * 2)
+            # Same clock as the app loop so blink phases line up with its re-renders
+            blink_phase = time.monotonic() % (self._cursor_blink_interval * 2)
             cursor_visible = blink_phase < self._cursor_blink_interval
 
         if text_input.text:
@@ -518,9 +515,7 @@ class GUIRenderer:
                         img_display.width, img_display.height,
                         COLOR_INDICES["list_border"])
 
-        # Get image data
-        image_data = img_display.image_data
-        if not image_data:
+        if not img_display.has_image:
             # No image loaded - draw placeholder text
             text = "NO IMAGE"
             text_width = get_text_width(text, self.scale, False)
@@ -581,17 +576,19 @@ class GUIRenderer:
         if not image_data:
             return
 
-        color_map = img_display.color_map
+        # Map whole rows through the registered color map with map(), so
+        # the per-pixel dict lookups run in C
+        lookup = (img_display.color_map or {}).get
+        find_closest = self._find_closest_color
         indexed = []
         for row in image_data:
-            indexed_row = []
-            for rgb in row:
-                # Use direct color mapping if available (registered image colors)
-                if color_map and rgb in color_map:
-                    indexed_row.append(color_map[rgb])
-                else:
-                    # Fallback to closest color for any unregistered colors
-                    indexed_row.append(self._find_closest_color(*rgb))
+            indexed_row = list(map(lookup, row))
+            if None in indexed_row:
+                # Fallback to closest color for any unregistered colors
+                indexed_row = [
+                    find_closest(*rgb) if idx is None else idx
+                    for rgb, idx in zip(row, indexed_row)
+                ]
             indexed.append(indexed_row)
         img_display.indexed_data = indexed
 
@@ -604,59 +601,58 @@ class GUIRenderer:
         clip_width: int, clip_height: int,
         zoom_factor: float
     ) -> None:
-        """Blit indexed image data to pixel buffer with zoom and clipping."""
+        """
+        Blit indexed image data to pixel buffer with zoom and clipping.
+
+        Each source row is resampled once (repeated for zoom in, strided
+        for zoom out) and copied into the buffer with slice assignment,
+        rather than placing every destination pixel individually.
+        """
         src_height = len(indexed_data)
         src_width = len(indexed_data[0]) if src_height > 0 else 0
         buf_height = len(pixels)
         buf_width = len(pixels[0]) if buf_height > 0 else 0
 
-        # Clipping bounds
-        clip_x2 = clip_x + clip_width
-        clip_y2 = clip_y + clip_height
-
         if zoom_factor >= 1:
-            # Zoom in: each source pixel becomes multiple destination pixels
+            # Zoom in: each source pixel becomes a scale x scale block
             scale = int(zoom_factor)
-            for src_y in range(src_height):
-                for src_x in range(src_width):
-                    color_idx = indexed_data[src_y][src_x]
-
-                    # Draw scaled pixel
-                    for dy in range(scale):
-                        for dx in range(scale):
-                            dst_x = start_x + src_x * scale + dx
-                            dst_y = start_y + src_y * scale + dy
-
-                            # Clip to content area and buffer
-                            if (clip_x <= dst_x < clip_x2 and
-                                clip_y <= dst_y < clip_y2 and
-                                0 <= dst_x < buf_width and
-                                0 <= dst_y < buf_height):
-                                pixels[dst_y][dst_x] = color_idx
+            display_width = src_width * scale
+            display_height = src_height * scale
         else:
-            # Zoom out: sample source pixels
+            # Zoom out: sample the top-left pixel of each block
             scale = int(1 / zoom_factor)
             display_width = src_width // scale
             display_height = src_height // scale
 
-            for dst_y_off in range(display_height):
-                for dst_x_off in range(display_width):
-                    # Sample from source (use top-left pixel of each block)
-                    src_x = dst_x_off * scale
-                    src_y = dst_y_off * scale
-
-                    if src_y < src_height and src_x < src_width:
-                        color_idx = indexed_data[src_y][src_x]
-
-                        dst_x = start_x + dst_x_off
-                        dst_y = start_y + dst_y_off
+        # Intersect the displayed image with the clip rect and the buffer
+        x0 = max(start_x, clip_x, 0)
+        x1 = min(start_x + display_width, clip_x + clip_width, buf_width)
+        y0 = max(start_y, clip_y, 0)
+        y1 = min(start_y + display_height, clip_y + clip_height, buf_height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        off_x0 = x0 - start_x
+        off_x1 = x1 - start_x
 
-                        # Clip to content area and buffer
-                        if (clip_x <= dst_x < clip_x2 and
-                            clip_y <= dst_y < clip_y2 and
-                            0 <= dst_x < buf_width and
-                            0 <= dst_y < buf_height):
-                            pixels[dst_y][dst_x] = color_idx
+        if zoom_factor >= 1:
+            last_src_y = -1
+            segment: List[int] = []
+            for dst_y in range(y0, y1):
+                src_y = (dst_y - start_y) // scale
+                if src_y != last_src_y:
+                    # Only the source columns that land inside the clip
+                    src_x0 = off_x0 // scale
+                    src_row = indexed_data[src_y][src_x0:(off_x1 - 1) // scale + 1]
+                    if scale > 1:
+                        src_row = [c for c in src_row for _ in range(scale)]
+                    lead = off_x0 - src_x0 * scale
+                    segment = src_row[lead:lead + (x1 - x0)]
+                    last_src_y = src_y
+                pixels[dst_y][x0:x1] = segment
+        else:
+            for dst_y in range(y0, y1):
+                src_row = indexed_data[(dst_y - start_y) * scale]
+                pixels[dst_y][x0:x1] = src_row[off_x0 * scale:off_x1 * scale:scale]
 
     def _find_closest_color(self, r: int, g: int, b: int) -> int:
         """Find the closest color index in the palette for an RGB value."""
@@ -8,7 +8,7 @@ Extends the base terminal interface to support mouse events for GUI interaction.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Protocol, Tuple, Optional, Union, runtime_checkable
+from typing import Protocol, Tuple, Optional, Sequence, Union, runtime_checkable
 
 
 class KeyType(Enum):
@@ -35,11 +35,20 @@ class MouseEventType(Enum):
     MOVE = "move"
 
 
-@dataclass(frozen=True)
+# Interned key events, keyed by (class, key type, value). Events are
+# immutable, so one shared instance per key replaces per-keystroke allocation.
+_KEY_EVENT_CACHE: dict = {}
+_KEY_EVENT_CACHE_LIMIT = 512  # Bounds memory for unusual (e.g. unicode) input
+
+
+@dataclass(frozen=True, slots=True)
 class KeyEvent:
     """
     Represents a keyboard input event.
 
+    Instances made through the factory classmethods are interned, so
+    repeated keys reuse the same object.
+
     Attributes:
         key_type: The type of key (character, arrow, special)
         value: The key value (character, arrow direction, or special key name)
@@ -47,20 +56,31 @@ class KeyEvent:
     key_type: KeyType
     value: str
 
+    @classmethod
+    def _interned(cls, key_type: KeyType, value: str) -> "KeyEvent":
+        """Return the shared event for this key, creating it on first use."""
+        key = (cls, key_type, value)
+        event = _KEY_EVENT_CACHE.get(key)
+        if event is None:
+            event = cls(key_type, value)
+            if len(_KEY_EVENT_CACHE) < _KEY_EVENT_CACHE_LIMIT:
+                _KEY_EVENT_CACHE[key] = event
+        return event
+
     @classmethod
     def character(cls, char: str) -> "KeyEvent":
         """Create a character key event."""
-        return cls(KeyType.CHARACTER, char)
+        return cls._interned(KeyType.CHARACTER, char)
 
     @classmethod
     def arrow(cls, direction: str) -> "KeyEvent":
         """Create an arrow key event. Direction: 'up', 'down', 'left', 'right'."""
-        return cls(KeyType.ARROW, direction)
+        return cls._interned(KeyType.ARROW, direction)
 
     @classmethod
     def special(cls, name: str) -> "KeyEvent":
         """Create a special key event (e.g., 'ctrl-c', 'escape')."""
-        return cls(KeyType.SPECIAL, name)
+        return cls._interned(KeyType.SPECIAL, name)
 
     @property
     def is_quit(self) -> bool:
@@ -321,6 +341,32 @@ class Terminal(ABC):
         """Check if mouse tracking is enabled."""
         ...
 
+    def fileno(self) -> Optional[int]:
+        """
+        Get the input file descriptor for use with select/selectors.
+
+        Returns None if input cannot be waited on via a file descriptor.
+        """
+        return None
+
+    def write_bytes(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Write pre-encoded bytes to the terminal.
+
+        The default decodes and forwards to write(); implementations backed
+        by a file descriptor should override this to skip the str round trip.
+        """
+        self.write(bytes(data).decode('utf-8'))
+
+    def write_chunks(self, chunks: Sequence[bytes]) -> None:
+        """
+        Write several byte strings as one payload.
+
+        The default joins them and calls write_bytes(); implementations
+        backed by a file descriptor can issue a single vectored write.
+        """
+        self.write_bytes(b"".join(chunks))
+
     def write_at(self, row: int, col: int, data: str) -> None:
         """Convenience method to move cursor and write data."""
         self.move_cursor(row, col)
@@ -12,7 +12,7 @@ import shutil
 import sys
 import termios
 import tty
-from typing import Optional, Tuple, List, Union
+from typing import Optional, Tuple, List, Sequence, Union
 
 from .base import (
     Terminal, KeyEvent, MouseEvent, MouseButton,
@@ -289,6 +289,28 @@ class UnixTerminal(Terminal):
         """Write data to the terminal."""
         sys.stdout.write(data)
 
+    def fileno(self) -> Optional[int]:
+        """Get the stdin file descriptor."""
+        return self._fd
+
+    def write_bytes(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Write bytes straight to the stdout file descriptor."""
+        # Flush buffered text first so output stays in order
+        sys.stdout.flush()
+        fd = sys.stdout.fileno()
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+    def write_chunks(self, chunks: Sequence[bytes]) -> None:
+        """Write all chunks with one writev() call, without concatenating."""
+        sys.stdout.flush()
+        written = os.writev(sys.stdout.fileno(), chunks)
+        if written < sum(len(chunk) for chunk in chunks):
+            # Rare short write: send the remainder the slow way
+            self.write_bytes(b"".join(chunks)[written:])
+
     def flush(self) -> None:
         """Flush the output buffer."""
         sys.stdout.flush()
@@ -5,15 +5,29 @@ Tests cover:
 - Input processing
 - Key event handling
 - Keyboard navigation
+- Input queue draining
+- Main loop wait scheduling and frame pacing
+- Frame change signatures
 """
 
 import sys
+import time
 import pytest
+from collections import deque
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app_loop import process_input, process_key_event
+from app_loop import (
+    process_input,
+    process_key_event,
+    drain_input_events,
+    compute_wait_timeout,
+    FramePacer,
+    RenderThread,
+    frame_signature,
+    run_app_loop,
+)
 from terminals.base import KeyEvent
 from gui import GUIState, Window, Button, TextInput, Checkbox, Slider
 
@@ -219,6 +233,39 @@ class TestProcessKeyEvent:
         should_continue, needs_render = process_key_event(key, gui)
         # Value should decrease
 
+    def test_enter_in_text_input_moves_focus(self):
+        """Test that Enter in a text field moves focus to the next window."""
+        gui = GUIState()
+        window1 = Window(title="W1", x=0, y=0, width=200, height=100)
+        ti = TextInput(10, 30, 120, 28)
+        window1.add_component(ti)
+        window2 = Window(title="W2", x=210, y=0, width=200, height=100)
+        btn = Button(220, 30, 80, 28, "OK")
+        window2.add_component(btn)
+        gui.add_window(window1)
+        gui.add_window(window2)
+        gui.focus_next()
+
+        should_continue, needs_render = process_key_event(KeyEvent.special('enter'), gui)
+        assert should_continue is True
+        assert needs_render is True
+        assert gui.get_focused_component() is btn
+
+    def test_escape_without_text_input_ignored(self):
+        """Test that Escape outside a text field needs no render."""
+        gui = GUIState()
+        should_continue, needs_render = process_key_event(KeyEvent.special('escape'), gui)
+        assert should_continue is True
+        assert needs_render is False
+
+    def test_unknown_special_key_ignored(self):
+        """Test that an unrecognized special key needs no render."""
+        gui = GUIState()
+        key = KeyEvent.special('csi-F')
+        should_continue, needs_render = process_key_event(key, gui)
+        assert should_continue is True
+        assert needs_render is False
+
 
 class TestProcessInput:
     """Tests for combined input processing."""
@@ -236,3 +283,180 @@ class TestProcessInput:
         key = KeyEvent.character('x')
         should_continue, needs_render = process_input(key, gui)
         assert should_continue is True
+
+
+class TestDrainInputEvents:
+    """Tests for draining the input event queue."""
+
+    def test_drain_empty_queue(self):
+        """Test that an empty queue needs no render."""
+        assert drain_input_events(deque(), GUIState()) == (True, False)
+
+    def test_drain_processes_all_events(self):
+        """Test that all queued events are consumed."""
+        gui = GUIState()
+        window = Window(title="TEST", x=0, y=0, width=200, height=100)
+        ti = TextInput(10, 30, 120, 28)
+        window.add_component(ti)
+        gui.add_window(window)
+        gui.focus_next()
+
+        events = deque([KeyEvent.character('h'), KeyEvent.character('i')])
+        assert drain_input_events(events, gui) == (True, True)
+        assert not events
+        assert ti.text == "hi"
+
+    def test_drain_no_render_for_ignored_keys(self):
+        """Test that unhandled keys don't request a render."""
+        events = deque([KeyEvent.character('x'), KeyEvent.special('f1')])
+        assert drain_input_events(events, GUIState()) == (True, False)
+
+    def test_drain_stops_at_quit(self):
+        """Test that draining stops at a quit event."""
+        events = deque([KeyEvent.character('q'), KeyEvent.character('x')])
+        should_continue, _ = drain_input_events(events, GUIState())
+        assert should_continue is False
+        assert len(events) == 1
+
+    def test_drain_folds_repeated_arrow_keys(self):
+        """Test that a run of one arrow key is applied as a single batch."""
+        gui = GUIState()
+        window = Window(title="TEST", x=0, y=0, width=200, height=100)
+        slider = Slider(10, 30, 100, 20, min_value=0, max_value=100, value=50)
+        window.add_component(slider)
+        gui.add_window(window)
+        gui.focus_next()
+
+        events = deque([KeyEvent.arrow('right')] * 4 + [KeyEvent.arrow('left')])
+        version = gui.dirty_version
+        assert drain_input_events(events, gui) == (True, True)
+        assert not events
+        assert slider.value == 65
+        assert gui.dirty_version == version + 2  # One bump per run
+
+    def test_drain_repeated_arrows_stop_at_list_end(self):
+        """Test that folded focus moves stop at the last component."""
+        gui = GUIState()
+        window = Window(title="TEST", x=0, y=0, width=200, height=200)
+        buttons = [Button(10, 30 + 40 * i, 80, 30, str(i)) for i in range(3)]
+        for button in buttons:
+            window.add_component(button)
+        gui.add_window(window)
+        gui.focus_next()
+
+        events = deque([KeyEvent.arrow('down')] * 5)
+        assert drain_input_events(events, gui) == (True, True)
+        assert gui.get_focused_component() is buttons[2]
+
+
+class TestRenderThread:
+    """Tests for the background render thread."""
+
+    def test_frames_published_while_requests_outpace_renders(self):
+        """Test that a slow renderer still publishes frames under a request flood."""
+        class SlowRenderer:
+            def __init__(self):
+                self.count = 0
+
+            def render_frame(self, gui_state):
+                time.sleep(0.03)
+                self.count += 1
+                return b"frame %d" % self.count
+
+        thread = RenderThread(SlowRenderer(), GUIState())
+        thread.start()
+        try:
+            published = set()
+            deadline = time.monotonic() + 0.4
+            while time.monotonic() < deadline:
+                thread.request_render()
+                time.sleep(0.01)
+                frame = thread.get_frame()
+                if frame is not None:
+                    published.add(frame)
+        finally:
+            thread.stop()
+            thread.join(timeout=1.0)
+
+        assert len(published) >= 3
+
+
+class TestRunAppLoop:
+    """Tests for run_app_loop argument checks."""
+
+    def test_non_positive_target_fps_rejected(self):
+        """Test that a zero or negative frame rate is refused up front."""
+        for fps in (0, -10):
+            with pytest.raises(ValueError):
+                run_app_loop(GUIState(), renderer=None, terminal=None, target_fps=fps)
+
+
+class TestFramePacer:
+    """Tests for adaptive frame pacing."""
+
+    def test_full_period_before_any_render(self):
+        """Test that the idle interval starts at the frame period."""
+        pacer = FramePacer(target_fps=25)
+        assert pacer.predicted_cost == 0.0
+        assert pacer.idle_interval == pytest.approx(0.04)
+
+    def test_idle_interval_subtracts_predicted_cost(self):
+        """Test that render cost is taken out of the frame period."""
+        pacer = FramePacer(target_fps=25)
+        for cost in (0.010, 0.012, 0.011):
+            pacer.record(cost)
+        assert pacer.predicted_cost == pytest.approx(0.011)
+        assert pacer.idle_interval == pytest.approx(0.029)
+
+    def test_prediction_ignores_outliers(self):
+        """Test that a single slow frame doesn't skew the prediction."""
+        pacer = FramePacer(target_fps=25)
+        for cost in (0.010, 0.010, 0.500):
+            pacer.record(cost)
+        assert pacer.predicted_cost == pytest.approx(0.010)
+
+    def test_idle_interval_never_negative(self):
+        """Test that renders slower than the period leave no idle gap."""
+        pacer = FramePacer(target_fps=30)
+        pacer.record(0.1)
+        assert pacer.idle_interval == 0.0
+
+    def test_prediction_uses_recent_window(self):
+        """Test that old samples fall out of the prediction."""
+        pacer = FramePacer(target_fps=25, window=3)
+        for cost in (0.030, 0.030, 0.030, 0.005, 0.005, 0.005):
+            pacer.record(cost)
+        assert pacer.predicted_cost == pytest.approx(0.005)
+
+
+class TestComputeWaitTimeout:
+    """Tests for main loop wake-up scheduling."""
+
+    def test_no_wake_times_blocks(self):
+        """Test that an idle loop blocks until input arrives."""
+        assert compute_wait_timeout(10.0, []) is None
+
+    def test_earliest_wake_time_wins(self):
+        """Test that the earliest scheduled wake-up is used."""
+        assert compute_wait_timeout(10.0, [10.5, 10.25]) == pytest.approx(0.25)
+
+    def test_overdue_wake_time_does_not_block(self):
+        """Test that an overdue wake-up yields a zero timeout."""
+        assert compute_wait_timeout(10.0, [9.0]) == 0.0
+
+
+class TestFrameSignature:
+    """Tests for the render change signature."""
+
+    def test_signature_stable_without_changes(self):
+        """Test that an idle GUI keeps the same signature."""
+        assert frame_signature(3, 0, False, 1.0) == frame_signature(3, 0, False, 50.0)
+
+    def test_signature_changes_with_dirty_version(self):
+        """Test that a state change produces a new signature."""
+        assert frame_signature(3, 0, False, 1.0) != frame_signature(4, 0, False, 1.0)
+
+    def test_signature_tracks_blink_phase(self):
+        """Test that the blink phase only matters while blinking."""
+        assert frame_signature(3, 0, True, 0.1) != frame_signature(3, 0, True, 0.7)
+        assert frame_signature(3, 0, True, 0.1) == frame_signature(3, 0, True, 0.5)
@@ -359,20 +359,49 @@ rows:
 
         # Apply bindings
         sync_callback = apply_bindings(gui_config)
-        sync_callback(0.016)  # Simulate one frame
+        assert sync_callback(0.016) is True  # Simulate one frame
 
         # After sync, progress should match slider
         assert progress.value == 50
 
+        # Nothing changed - callback reports no update
+        assert sync_callback(0.016) is False
+
         # Change slider value
         slider.value = 75
-        sync_callback(0.016)
+        assert sync_callback(0.016) is True
 
         # Progress should update
         assert progress.value == 75
 
         Path(config_with_bindings).unlink()
 
+    def test_binding_fans_out_from_one_source(self):
+        """Test that one source can drive several targets."""
+        slider = Slider(0, 0, 100, 30, value=40.0)
+        progress_a = ProgressBar(0, 40, 100, 30)
+        progress_b = ProgressBar(0, 80, 100, 30)
+        gui_config = GUIConfig(
+            layout=LayoutConfig(),
+            bindings=[Binding('s', 'a'), Binding('s', 'b')],
+            widgets_by_id={'s': slider, 'a': progress_a, 'b': progress_b},
+        )
+
+        sync_callback = apply_bindings(gui_config)
+        assert sync_callback(0.016) is True
+        assert progress_a.value == 40.0
+        assert progress_b.value == 40.0
+
+    def test_binding_with_missing_endpoint_ignored(self):
+        """Test that bindings to unknown widgets are skipped."""
+        gui_config = GUIConfig(
+            layout=LayoutConfig(),
+            bindings=[Binding('missing', 'also_missing')],
+        )
+
+        sync_callback = apply_bindings(gui_config)
+        assert sync_callback(0.016) is False
+
 
 class TestMultiRowLayout:
     """Tests for multi-row layouts."""
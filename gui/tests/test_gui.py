@@ -12,6 +12,7 @@ Tests cover:
 - List box component
 - Window container
 - GUI state management
+- Spatial hit-test index
 """
 
 import sys
@@ -36,6 +37,7 @@ from gui import (
     ImageDisplay,
     Window,
     GUIState,
+    Quadtree,
 )
 
 
@@ -72,6 +74,13 @@ class TestBounds:
         assert bounds.contains(9, 9) is True
         assert bounds.contains(10, 10) is False  # Exclusive upper bound
 
+    def test_bounds_immutable(self):
+        """Test that bounds can't drift from their cached edges."""
+        bounds = Bounds(0, 0, 10, 10)
+        with pytest.raises(AttributeError):
+            bounds.x = 5
+        assert bounds == Bounds(0, 0, 10, 10)
+
 
 class TestButton:
     """Tests for the Button component."""
@@ -86,6 +95,22 @@ class TestButton:
         assert btn.label == "TEST"
         assert btn.toggled is False
 
+    def test_button_has_no_instance_dict(self):
+        """Test that components use slots rather than a per-instance dict."""
+        btn = Button(10, 20, 80, 30, "Click")
+        assert not hasattr(btn, '__dict__')
+        with pytest.raises(AttributeError):
+            btn.not_an_attribute = 1
+
+    def test_button_set_hover_reports_changes(self):
+        """Test that set_hover only reports actual state changes."""
+        btn = Button(10, 20, 80, 30, "Click")
+        assert btn.set_hover(True) is True
+        assert btn.set_hover(True) is False
+        assert btn.state == ComponentState.HOVER
+        assert btn.set_hover(False) is True
+        assert btn.state == ComponentState.NORMAL
+
     def test_button_click_toggles(self):
         """Test that clicking a button toggles its state."""
         btn = Button(10, 20, 100, 30, "TEST")
@@ -124,6 +149,21 @@ class TestButton:
         btn.enabled = False
         assert btn.state == ComponentState.DISABLED
 
+    def test_disabled_focused_button_loses_focus_on_clear(self):
+        """Test that clear_focus resets focus even on disabled components."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        btn = Button(10, 20, 100, 30, "TEST")
+        w.add_component(btn)
+        gui.add_window(w)
+        gui.focus_next()
+        assert btn.state == ComponentState.FOCUSED
+
+        btn.enabled = False
+        gui.clear_focus()
+        btn.enabled = True
+        assert btn.state == ComponentState.NORMAL
+
 
 class TestCheckbox:
     """Tests for the Checkbox component."""
@@ -205,6 +245,22 @@ class TestRadioButton:
         assert group.selected_value == "Option B"
         assert group.selected_index == 1
 
+    def test_radio_group_later_preselected_button_wins(self):
+        """Test that adding a second preselected button deselects the first."""
+        group = RadioGroup()
+        changes = []
+        group.set_on_change(lambda i, label: changes.append((i, label)))
+        rb1 = RadioButton(10, 20, 100, 24, "A", selected=True)
+        rb2 = RadioButton(10, 50, 100, 24, "B")
+        rb3 = RadioButton(10, 80, 100, 24, "C", selected=True)
+
+        for rb in (rb1, rb2, rb3):
+            group.add_button(rb)
+
+        assert [rb.selected for rb in (rb1, rb2, rb3)] == [False, False, True]
+        assert group.selected_index == 2
+        assert changes == [(0, "A"), (2, "C")]
+
     def test_radio_click_selects(self):
         """Test that clicking a radio button selects it."""
         group = RadioGroup()
@@ -278,6 +334,24 @@ class TestTextInput:
         ti.move_cursor_right()
         assert ti.cursor_pos == 2
 
+    def test_text_input_edits_at_cursor(self):
+        """Test inserting and deleting in the middle of the text."""
+        changes = []
+        ti = TextInput(10, 20, 150, 28, on_change=changes.append)
+        ti.focus()
+        for ch in "ABD":
+            ti.insert_char(ch)
+        ti.move_cursor_left()
+        ti.insert_char('C')
+        assert ti.text == "ABCD"
+        assert ti.cursor_pos == 3
+
+        ti.move_cursor_left()
+        ti.delete_char()
+        assert ti.text == "ACD"
+        assert ti.cursor_pos == 1
+        assert changes[-2:] == ["ABCD", "ACD"]
+
     def test_text_input_max_length(self):
         """Test max length constraint."""
         ti = TextInput(10, 20, 150, 28, max_length=3)
@@ -313,6 +387,17 @@ class TestSlider:
         slider = Slider(10, 20, 100, 20, min_value=50, max_value=150, value=100)
         assert slider.percentage == 50.0
 
+    def test_slider_percentage_follows_range_changes(self):
+        """Test that percentage tracks min/max changes and a zero range."""
+        slider = Slider(10, 20, 100, 20, min_value=0, max_value=100, value=50)
+        slider.max_value = 200
+        assert slider.percentage == 25.0
+        slider.value = 100
+        assert slider.percentage == 50.0
+
+        slider = Slider(10, 20, 100, 20, min_value=5, max_value=5, value=5)
+        assert slider.percentage == 0.0
+
     def test_slider_value_clamping(self):
         """Test that slider values are clamped."""
         slider = Slider(10, 20, 100, 20, min_value=0, max_value=100, value=50)
@@ -355,6 +440,12 @@ class TestProgressBar:
         pb = ProgressBar(10, 20, 150, 24, value=50)
         pb.increment(10)
         assert pb.value == 60
+        assert pb.percentage == 60.0
+
+    def test_progress_bar_zero_max(self):
+        """Test that a zero maximum reports 0%."""
+        pb = ProgressBar(10, 20, 150, 24, value=10, max_value=0)
+        assert pb.percentage == 0.0
 
     def test_progress_bar_value_clamping(self):
         """Test that progress values are clamped."""
@@ -391,6 +482,22 @@ class TestListBox:
         assert len(lb.items) == 2
         assert lb.items[1].value == "value2"
 
+    def test_listbox_update_hover_reports_changes(self):
+        """Test that update_hover only reports a change of hovered item."""
+        lb = ListBox(10, 20, 150, 100, items=["A", "B"])
+        assert lb.update_hover(50, 25) is True
+        assert lb.hover_index == 0
+        assert lb.update_hover(60, 26) is False
+        assert lb.update_hover(500, 500) is True
+        assert lb.hover_index == -1
+
+    def test_listbox_add_items(self):
+        """Test adding a batch of items."""
+        lb = ListBox(10, 20, 150, 100, items=["A"])
+        lb.add_items(["B", "C"])
+        assert [item.label for item in lb.items] == ["A", "B", "C"]
+        assert lb.items[2].value == "C"
+
     def test_listbox_click_selects(self):
         """Test that clicking selects an item."""
         lb = ListBox(10, 20, 120, 100, items=["A", "B", "C"])
@@ -398,6 +505,14 @@ class TestListBox:
         lb.on_click(50, 20 + lb.item_height)
         assert lb.selected_index == 1
 
+    def test_listbox_item_indices_batch(self):
+        """Test resolving a batch of y positions to item indices."""
+        lb = ListBox(10, 20, 120, 200, items=["A", "B", "C"])
+        h = lb.item_height
+        assert lb.get_item_indices_at([20, 20 + h, 20 + 2 * h + 1, 20 + 3 * h, 19]) == [
+            0, 1, 2, -1, -1
+        ]
+
 
 class TestWindow:
     """Tests for the Window container."""
@@ -410,6 +525,12 @@ class TestWindow:
         assert w.y == 20
         assert len(w.components) == 0
 
+    def test_window_uses_slots(self):
+        """Test that windows reject attributes they don't declare."""
+        w = Window(title="Test", x=10, y=20, width=200, height=150)
+        with pytest.raises(AttributeError):
+            w.not_a_field = 1
+
     def test_window_add_component(self):
         """Test adding components to a window."""
         w = Window(title="Test", x=10, y=20, width=200, height=150)
@@ -435,6 +556,79 @@ class TestWindow:
         component = w.get_component_at(100, 45)
         assert component is None
 
+    def test_window_get_component_at_prefers_topmost(self):
+        """Test that overlapping hits resolve to the last added component."""
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        below = Button(10, 30, 80, 30, "Below")
+        above = Button(40, 30, 80, 30, "Above")
+        w.add_component(below)
+        w.add_component(above)
+
+        assert w.get_component_at(20, 40) is below
+        assert w.get_component_at(50, 40) is above
+        above.visible = False
+        assert w.get_component_at(50, 40) is below
+
+    def test_window_get_component_at_reuses_last_hit(self):
+        """Test that the cached last hit tracks movement and visibility."""
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        a = Button(10, 30, 80, 30, "A")
+        b = Button(100, 30, 80, 30, "B")
+        w.add_component(a)
+        w.add_component(b)
+
+        assert w.get_component_at(20, 40) is a
+        assert w.get_component_at(30, 45) is a
+        assert w.get_component_at(110, 40) is b
+        b.visible = False
+        assert w.get_component_at(110, 40) is None
+
+    def test_window_get_component_at_after_add(self):
+        """Test that components added after a hit test are found."""
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        w.add_component(Button(10, 30, 80, 30, "A"))
+        assert w.get_component_at(50, 100) is None
+
+        btn = Button(10, 90, 80, 30, "B")
+        w.add_component(btn)
+        assert w.get_component_at(50, 100) is btn
+
+
+class TestQuadtree:
+    """Tests for the Quadtree hit-test index."""
+
+    def test_empty_tree(self):
+        """Test that an empty tree finds nothing."""
+        assert Quadtree.build([]).query_point(0, 0) == []
+
+    def test_query_many_items(self):
+        """Test point queries on a grid large enough to subdivide."""
+        rects = [(x * 10, y * 10, 10, 10, (x, y)) for y in range(20) for x in range(20)]
+        tree = Quadtree.build(rects)
+
+        assert tree.query_point(55, 123) == [(12 * 20 + 5, (5, 12))]
+        assert tree.query_point(0, 0)[0][1] == (0, 0)
+        assert tree.query_point(199, 199)[0][1] == (19, 19)
+        assert tree.query_point(200, 50) == []
+        assert tree.query_point(-1, 50) == []
+
+    def test_spanning_item_found_in_every_quadrant(self):
+        """Test that an item covering several quadrants is hit everywhere."""
+        rects = [(x * 10, 0, 10, 10, x) for x in range(10)]
+        rects.append((0, 0, 100, 100, 'background'))
+        tree = Quadtree.build(rects)
+
+        for px, py in ((5, 5), (95, 5), (5, 95), (95, 95)):
+            assert 'background' in [item for _, item in tree.query_point(px, py)]
+
+    def test_occluded_items(self):
+        """Test that only items overlapped by a later item are occluded."""
+        rects = [(x * 10, y * 10, 10, 10, (x, y)) for y in range(10) for x in range(10)]
+        rects.append((15, 15, 10, 10, 'overlay'))
+        tree = Quadtree.build(rects)
+
+        assert tree.occluded_items() == {(1, 1), (2, 1), (1, 2), (2, 2)}
+
 
 class TestGUIState:
     """Tests for the GUIState class."""
@@ -472,6 +666,43 @@ class TestGUIState:
         assert component is btn
         assert btn.toggled is True
 
+    def test_gui_state_handle_click_reaches_each_component(self):
+        """Test that clicks routed by GUIState act on every component type."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=300, height=300)
+        cb = Checkbox(10, 10, 100, 24, "Check")
+        slider = Slider(10, 50, 100, 20, min_value=0, max_value=100, value=0)
+        lb = ListBox(10, 80, 150, 100, items=["A", "B", "C"])
+        pb = ProgressBar(10, 200, 150, 24, value=40)
+        for component in (cb, slider, lb, pb):
+            w.add_component(component)
+        gui.add_window(w)
+
+        gui.handle_click(20, 20)
+        gui.handle_click(60, 60)
+        gui.handle_click(20, 80 + lb.item_height + 1)
+        assert gui.handle_click(50, 210) is pb
+
+        assert cb.checked is True
+        assert slider.value == 50.0
+        assert lb.selected_index == 1
+        assert pb.value == 40
+
+    def test_progress_bar_is_skipped_by_keyboard_focus(self):
+        """Test that arrow navigation never lands on a progress bar."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=200)
+        btn1 = Button(10, 10, 80, 30, "A")
+        w.add_component(btn1)
+        w.add_component(ProgressBar(10, 50, 150, 24, value=10))
+        btn2 = Button(10, 90, 80, 30, "B")
+        w.add_component(btn2)
+        gui.add_window(w)
+        gui.focus_next()
+
+        gui.handle_special_key('down')
+        assert gui.get_focused_component() is btn2
+
     def test_gui_state_handle_key(self):
         """Test handling key input for focused component."""
         gui = GUIState()
@@ -488,6 +719,314 @@ class TestGUIState:
         gui.handle_key('A')
         assert ti.text == "A"
 
+    def test_dirty_version_bumps_on_changes(self):
+        """Test that state mutators bump the dirty version."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        w.add_component(Slider(10, 30, 100, 20))
+        gui.add_window(w)
+
+        version = gui.dirty_version
+        gui.focus_next()
+        assert gui.dirty_version > version
+
+        version = gui.dirty_version
+        gui.handle_special_key('right')
+        assert gui.dirty_version > version
+
+    def test_slider_arrow_keys_step_and_clamp(self):
+        """Test that left/right step a slider by 5% and stay in range."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        slider = Slider(10, 30, 100, 20, min_value=0, max_value=100, value=98)
+        w.add_component(slider)
+        gui.add_window(w)
+        gui.focus_next()
+
+        assert gui.handle_special_key('right') is True
+        assert slider.value == 100
+        gui.handle_special_key('left')
+        assert slider.value == 95
+
+    def test_slider_arrow_step_follows_range_changes(self):
+        """Test that the arrow-key step is recomputed when the range changes."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        slider = Slider(10, 30, 100, 20, min_value=0, max_value=100, value=50)
+        w.add_component(slider)
+        gui.add_window(w)
+        gui.focus_next()
+
+        slider.max_value = 200
+        gui.handle_special_key('right')
+        assert slider.value == 60
+
+    def test_repeated_down_focuses_only_the_last_component(self):
+        """Test that a run of presses leaves a single focused component."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=200)
+        boxes = [Checkbox(10, 20 + 30 * i, 100, 20, f"CB{i}") for i in range(4)]
+        for cb in boxes:
+            w.add_component(cb)
+        gui.add_window(w)
+        gui.focus_next()
+
+        assert gui.handle_special_key('down', 2) is True
+        assert gui.get_focused_component() is boxes[2]
+        assert [cb.state for cb in boxes] == [
+            ComponentState.NORMAL, ComponentState.NORMAL,
+            ComponentState.FOCUSED, ComponentState.NORMAL,
+        ]
+
+    def test_moving_onto_radio_selects_it_except_from_inputs(self):
+        """Test that focus moves onto a radio select it, except from text/slider."""
+        for first, selects in ((Button(10, 20, 100, 30, "B"), True),
+                               (Checkbox(10, 20, 100, 30, "C"), True),
+                               (ListBox(10, 20, 100, 30, items=["A"]), True),
+                               (TextInput(10, 20, 100, 30), False),
+                               (Slider(10, 20, 100, 30), False)):
+            gui = GUIState()
+            w = Window(title="Test", x=0, y=0, width=200, height=150)
+            group = RadioGroup()
+            radios = [RadioButton(10, 60 + 30 * i, 100, 20, f"R{i}", selected=i == 1)
+                      for i in range(2)]
+            w.add_component(first)
+            for radio in radios:
+                group.add_button(radio)
+                w.add_component(radio)
+            gui.add_window(w)
+            gui.focus_next()
+
+            assert gui.handle_special_key('down') is True
+            assert radios[0].selected is selects
+
+    def test_tab_in_single_window_is_a_no_op(self):
+        """Test that cycling focus in a lone focused window changes nothing."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        btn = Button(10, 20, 100, 30, "TEST")
+        w.add_component(btn)
+        gui.add_window(w)
+        gui.focus_next()
+
+        version = gui.dirty_version
+        gui.focus_next()
+        gui.focus_previous()
+        assert gui.dirty_version == version
+        assert btn.state == ComponentState.FOCUSED
+
+        # Once focus is cleared, Tab restores it
+        gui.clear_focus()
+        gui.focus_next()
+        assert w.active and btn.state == ComponentState.FOCUSED
+
+    def test_tab_in_single_window_blurs_click_focused_input(self):
+        """Test that Tab in a lone window still blurs a click-focused input."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        btn = Button(10, 20, 100, 30, "TEST")
+        ti = TextInput(10, 60, 120, 28)
+        w.add_component(btn)
+        w.add_component(ti)
+        gui.add_window(w)
+        gui.focus_next()
+        gui.handle_click(20, 70)
+        assert ti.has_focus is True
+
+        gui.focus_next()
+        assert ti.has_focus is False
+        assert ti.state == ComponentState.NORMAL
+        assert btn.state == ComponentState.FOCUSED
+
+    def test_dirty_windows_tracking(self):
+        """Test marking, listing and clearing dirty windows."""
+        gui = GUIState()
+        for i in range(3):
+            gui.add_window(Window(title=f"W{i}", x=i * 100, y=0, width=100, height=100))
+        assert gui.get_dirty_windows() == [0, 1, 2]  # Initial full redraw
+
+        gui.clear_dirty()
+        assert gui.is_dirty() is False
+        gui.mark_dirty(2)
+        gui.mark_dirty(0)
+        gui.mark_dirty(2)
+        assert gui.is_dirty() is True
+        assert gui.get_dirty_windows() == [0, 2]
+
+        gui.clear_dirty()
+        assert gui.get_dirty_windows() == []
+
+    def test_mark_window_dirty_by_window(self):
+        """Test marking a window dirty through the window object."""
+        gui = GUIState()
+        windows = [Window(title=f"W{i}", x=i * 100, y=0, width=100, height=100) for i in range(3)]
+        for w in windows:
+            gui.add_window(w)
+        gui.clear_dirty()
+
+        gui.mark_window_dirty(windows[1])
+        assert gui.get_dirty_windows() == [1]
+
+        gui.clear_dirty()
+        version = gui.dirty_version
+        gui.mark_window_dirty(windows[2], bump_version=False)
+        assert gui.dirty_version == version
+        assert gui.get_dirty_windows() == [2]
+
+    def test_dirty_version_unchanged_when_key_not_handled(self):
+        """Test that unhandled keys leave the dirty version alone."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        w.add_component(Slider(10, 30, 100, 20))
+        gui.add_window(w)
+        gui.focus_next()
+
+        version = gui.dirty_version
+        assert gui.handle_key('A') is False
+        assert gui.dirty_version == version
+
+    def test_focused_component_follows_arrow_navigation(self):
+        """Test that the cached focused component tracks focus moves."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        first = Checkbox(10, 30, 100, 20, "A")
+        second = Checkbox(10, 60, 100, 20, "B")
+        w.add_component(first)
+        w.add_component(second)
+        gui.add_window(w)
+        gui.focus_next()
+
+        assert gui.get_focused_component() is first
+        assert gui.get_focused_component() is first
+        assert gui.handle_special_key('down') is True
+        assert gui.get_focused_component() is second
+
+    def test_focus_moves_leave_single_focused_component(self):
+        """Test that moving focus resets the previous window and component."""
+        gui = GUIState()
+        w1 = Window(title="W1", x=0, y=0, width=200, height=150)
+        ti = TextInput(10, 30, 120, 28)
+        w1.add_component(ti)
+        w2 = Window(title="W2", x=210, y=0, width=200, height=150)
+        btn = Button(220, 30, 80, 25, "OK")
+        w2.add_component(btn)
+        gui.add_window(w1)
+        gui.add_window(w2)
+
+        gui.focus_next()
+        assert ti.has_focus and w1.active
+        gui.focus_next()
+        assert not ti.has_focus and ti.state == ComponentState.NORMAL
+        assert not w1.active
+        assert w2.active and btn.state == ComponentState.FOCUSED
+        gui.focus_next()
+        assert btn.state == ComponentState.NORMAL and not w2.active
+        assert ti.has_focus and w1.active
+
+    def test_activate_dispatches_for_subclasses(self):
+        """Test that component subclasses use their base type's handlers."""
+        class FancyButton(Button):
+            pass
+
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        btn = FancyButton(10, 30, 80, 25, "OK", toggle=True)
+        w.add_component(btn)
+        w.add_component(Checkbox(10, 60, 100, 20, "B"))
+        gui.add_window(w)
+        gui.focus_next()
+
+        assert gui.activate_focused() is True
+        assert btn.toggled is True
+        assert gui.handle_special_key('down') is True
+
+    def test_focused_component_skips_newly_disabled(self):
+        """Test that disabling a component is seen without mark_dirty."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        first = Checkbox(10, 30, 100, 20, "A")
+        second = Checkbox(10, 60, 100, 20, "B")
+        w.add_component(first)
+        w.add_component(second)
+        gui.add_window(w)
+        gui.focus_next()
+        assert gui.get_focused_component() is first
+
+        first.enabled = False
+        assert gui.get_focused_component() is second
+        first.enabled = True
+        assert gui.get_focused_component() is first
+
+    def test_focused_component_sees_added_components(self):
+        """Test that adding a component to the focused window is picked up."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        gui.add_window(w)
+        gui.focus_next()
+        assert gui.get_focused_component() is None
+
+        btn = Button(10, 30, 80, 25, "OK")
+        w.add_component(btn)
+        assert gui.get_focused_component() is btn
+
+    def test_clear_focus_resets_click_focused_input(self):
+        """Test that clear_focus also resets inputs focused by a click."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        btn = Button(10, 20, 100, 30, "TEST")
+        ti = TextInput(10, 60, 120, 28)
+        w.add_component(btn)
+        w.add_component(ti)
+        gui.add_window(w)
+        gui.focus_next()
+        gui.handle_click(20, 70)
+        assert ti.state == ComponentState.FOCUSED
+
+        gui.clear_focus()
+        assert btn.state == ComponentState.NORMAL
+        assert ti.state == ComponentState.NORMAL
+        assert w.active is False
+
+        gui.focus_next()
+        assert ti.has_focus is False
+        assert btn.state == ComponentState.FOCUSED
+
+    def test_escape_then_tab_leaves_one_focused_input(self):
+        """Test that Tab after clear_focus blurs the previous input."""
+        gui = GUIState()
+        inputs = []
+        for i in range(2):
+            w = Window(title=f"W{i}", x=i * 210, y=0, width=200, height=150)
+            ti = TextInput(i * 210 + 10, 30, 120, 28)
+            w.add_component(ti)
+            gui.add_window(w)
+            inputs.append(ti)
+        gui.focus_next()
+        assert inputs[0].has_focus is True
+
+        gui.clear_focus()
+        gui.focus_next()
+        assert inputs[0].has_focus is False
+        assert inputs[1].has_focus is True
+
+    def test_focus_move_blurs_click_focused_input(self):
+        """Test that moving focus away blurs an input focused by a click."""
+        gui = GUIState()
+        ti = TextInput(220, 30, 120, 28)
+        buttons = [Button(10, 30, 100, 30, "A"), Button(430, 30, 100, 30, "B")]
+        for i, component in enumerate((buttons[0], ti, buttons[1])):
+            w = Window(title=f"W{i}", x=i * 210, y=0, width=200, height=150)
+            w.add_component(component)
+            gui.add_window(w)
+        gui.focus_next()
+        gui.handle_click(230, 40)
+        assert ti.has_focus is True
+
+        gui.focus_previous()
+        assert ti.has_focus is False
+        assert ti.state == ComponentState.NORMAL
+        assert buttons[1].state == ComponentState.FOCUSED
+
 
 class TestImageDisplay:
     """Tests for the ImageDisplay component."""
@@ -503,6 +1042,7 @@ class TestImageDisplay:
         assert img.zoom_factor == 1.0
         assert img.image_data is None
         assert img.indexed_data is None
+        assert img.has_image is False
 
     def test_image_display_with_image(self):
         """Test creating an image display with a valid image."""
@@ -512,6 +1052,28 @@ class TestImageDisplay:
         assert img.image_width == 256
         assert img.image_height == 256
 
+    def test_image_display_pixel_rows_and_colors(self, tmp_path):
+        """Test that loaded pixels keep row order and every color is mapped."""
+        Image = pytest.importorskip("PIL.Image")
+        src = Image.new('RGB', (3, 2), (10, 20, 30))
+        src.putpixel((2, 0), (200, 0, 0))
+        src.putpixel((0, 1), (0, 200, 0))
+        path = tmp_path / "tiny.png"
+        src.save(path)
+
+        img = ImageDisplay(10, 20, 100, 80, image_path=str(path))
+        assert img.has_image is True
+        cm = img.color_map
+        assert img.indexed_data == [
+            [cm[(10, 20, 30)], cm[(10, 20, 30)], cm[(200, 0, 0)]],
+            [cm[(0, 200, 0)], cm[(10, 20, 30)], cm[(10, 20, 30)]],
+        ]
+        assert img.image_data == [
+            [(10, 20, 30), (10, 20, 30), (200, 0, 0)],
+            [(0, 200, 0), (10, 20, 30), (10, 20, 30)],
+        ]
+        assert set(img.color_map) == {(10, 20, 30), (200, 0, 0), (0, 200, 0)}
+
     def test_image_display_zoom_in(self):
         """Test zooming in."""
         img = ImageDisplay(10, 20, 100, 80)
@@ -565,6 +1127,21 @@ class TestImageDisplay:
         assert result is False
         assert img.zoom_level == ImageDisplay.MAX_ZOOM_LEVEL
 
+    def test_repeated_zoom_keys_stop_at_the_limit(self):
+        """Test that a run of zoom keys ends once the zoom limit is hit."""
+        gui = GUIState()
+        w = Window(title="Test", x=0, y=0, width=200, height=150)
+        img = ImageDisplay(10, 30, 100, 80)
+        w.add_component(img)
+        gui.add_window(w)
+        gui.focus_next()
+
+        assert gui.handle_special_key('up', 10) is True
+        assert img.zoom_level == ImageDisplay.MAX_ZOOM_LEVEL
+        version = gui.dirty_version
+        assert gui.handle_special_key('up') is False
+        assert gui.dirty_version == version
+
     def test_image_display_zoom_callback(self):
         """Test zoom callback is called."""
         zoom_levels = []
@@ -26,11 +26,13 @@ from gui import (
 from sixel import SIXEL_START, SIXEL_END, ITERM2_IMAGE_START, ITERM2_IMAGE_END, IS_ITERM2
 
 
-def frame_has_valid_format(frame: str) -> bool:
+def frame_has_valid_format(frame: bytes) -> bool:
     """Check if frame output has a valid terminal graphics format (sixel or iTerm2)."""
     if IS_ITERM2:
-        return frame.startswith(ITERM2_IMAGE_START) and frame.endswith(ITERM2_IMAGE_END)
-    return frame.startswith(SIXEL_START) and frame.endswith(SIXEL_END)
+        start, end = ITERM2_IMAGE_START, ITERM2_IMAGE_END
+    else:
+        start, end = SIXEL_START, SIXEL_END
+    return frame.startswith(start.encode('ascii')) and frame.endswith(end.encode('ascii'))
 
 
 class TestFullGUIRendering:
@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from renderer import GUIRenderer
 from gui import (
     GUIState,
+    ComponentState,
     Window,
     Button,
     Checkbox,
@@ -31,11 +32,13 @@ from gui import (
 from sixel import SIXEL_START, SIXEL_END, ITERM2_IMAGE_START, ITERM2_IMAGE_END, IS_ITERM2
 
 
-def frame_has_valid_format(frame: str) -> bool:
+def frame_has_valid_format(frame: bytes) -> bool:
     """Check if frame output has a valid terminal graphics format (sixel or iTerm2)."""
     if IS_ITERM2:
-        return frame.startswith(ITERM2_IMAGE_START) and frame.endswith(ITERM2_IMAGE_END)
-    return frame.startswith(SIXEL_START) and frame.endswith(SIXEL_END)
+        start, end = ITERM2_IMAGE_START, ITERM2_IMAGE_END
+    else:
+        start, end = SIXEL_START, SIXEL_END
+    return frame.startswith(start.encode('ascii')) and frame.endswith(end.encode('ascii'))
 
 
 class TestRendererInit:
@@ -65,6 +68,14 @@ class TestRenderFrame:
 
         assert frame_has_valid_format(frame)
 
+    def test_render_frame_returns_bytes(self):
+        """Test that frames come back encoded, ready for the terminal."""
+        renderer = GUIRenderer(width=200, height=100)
+        frame = renderer.render_frame(GUIState())
+
+        assert isinstance(frame, bytes)
+        assert frame.isascii()
+
     def test_render_with_window(self):
         """Test rendering GUI with a window."""
         renderer = GUIRenderer(width=300, height=200)
@@ -231,6 +242,44 @@ class TestComponentRendering:
         frame = renderer.render_frame(gui)
         assert frame_has_valid_format(frame)
 
+    def test_indexed_cache_maps_colors_with_closest_fallback(self):
+        """Test that mapped colors use the color map and others the palette."""
+        renderer = GUIRenderer(width=200, height=150)
+        img = ImageDisplay(10, 30, 140, 100)
+        img._image_data = [[(1, 2, 3), (0, 0, 0)], [(0, 0, 0), (1, 2, 3)]]
+        img._color_map = {(1, 2, 3): 99}
+
+        renderer._build_indexed_cache(img)
+        black = renderer._find_closest_color(0, 0, 0)
+        assert img.indexed_data == [[99, black], [black, 99]]
+
+    def test_blit_indexed_zoomed_scales_and_clips(self):
+        """Test zoomed blits repeat or sample pixels and respect the clip."""
+        renderer = GUIRenderer(width=200, height=150)
+        data = [[1, 2], [3, 4]]
+
+        pixels = [[0] * 5 for _ in range(5)]
+        renderer._blit_indexed_zoomed(pixels, data, 0, 0, 1, 0, 4, 3, 2.0)
+        assert pixels[:4] == [
+            [0, 1, 2, 2, 0],
+            [0, 1, 2, 2, 0],
+            [0, 3, 4, 4, 0],
+            [0, 0, 0, 0, 0],
+        ]
+
+        pixels = [[0] * 3 for _ in range(3)]
+        renderer._blit_indexed_zoomed(pixels, data, 1, 1, 0, 0, 3, 3, 0.5)
+        assert pixels == [[0, 0, 0], [0, 1, 0], [0, 0, 0]]
+
+    def test_button_colors_per_state(self):
+        """Test the button color lookup for each component state."""
+        renderer = GUIRenderer(width=200, height=150)
+        normal = renderer._get_button_colors(ComponentState.NORMAL)
+        assert renderer._get_button_colors(ComponentState.FOCUSED) == normal
+        assert renderer._get_button_colors(ComponentState.HOVER) != normal
+        disabled = renderer._get_button_colors(ComponentState.DISABLED)
+        assert disabled[:2] == normal[:2] and disabled[2] != normal[2]
+
 
 class TestMultipleWindows:
     """Tests for rendering multiple windows."""
@@ -52,6 +52,16 @@ class TestKeyEvent:
         assert key.key_type == KeyType.SPECIAL
         assert key.value == 'ctrl-c'
 
+    def test_repeated_keys_share_instance(self):
+        """Test that factory-made events are interned."""
+        assert KeyEvent.character('a') is KeyEvent.character('a')
+        assert KeyEvent.arrow('up') is KeyEvent.arrow('up')
+        assert KeyEvent.special('tab') is not KeyEvent.character('tab')
+
+    def test_interned_events_still_compare_by_value(self):
+        """Test that directly constructed events equal interned ones."""
+        assert KeyEvent(KeyType.CHARACTER, 'a') == KeyEvent.character('a')
+
     def test_is_quit_q_lowercase(self):
         """Test that 'q' is a quit key."""
         key = KeyEvent.character('q')
@@ -133,6 +143,20 @@ class TestMockTerminal:
         mock_terminal.write("World")
         assert mock_terminal.written_data == ["Hello", "World"]
 
+    def test_fileno_defaults_to_none(self, mock_terminal):
+        """Test that terminals without an input fd report None."""
+        assert mock_terminal.fileno() is None
+
+    def test_write_bytes_falls_back_to_write(self, mock_terminal):
+        """Test that the default write_bytes decodes and forwards to write."""
+        mock_terminal.write_bytes(memoryview(b"\x1bPqFRAME"))
+        assert mock_terminal.written_data == ["\x1bPqFRAME"]
+
+    def test_write_chunks_falls_back_to_single_write(self, mock_terminal):
+        """Test that the default write_chunks emits one joined write."""
+        mock_terminal.write_chunks((b"\x1b[H", b"FRAME"))
+        assert mock_terminal.written_data == ["\x1b[HFRAME"]
+
     def test_mock_terminal_read_key(self, mock_terminal):
         """Test mock terminal read key."""
         mock_terminal.add_key(KeyEvent.character('a'))